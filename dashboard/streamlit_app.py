@@ -4,117 +4,179 @@ Run from repo root: streamlit run dashboard/streamlit_app.py
 """
 from __future__ import annotations
 
-import re
 import sqlite3
-import unicodedata
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
 import streamlit as st
 
 DB_PATH = Path(__file__).resolve().parent / "data" / "vedic_wisdom.db"
 
 
+@st.cache_resource
+def _conn() -> sqlite3.Connection | None:
+    """One read-only connection shared by every session and rerun; None until the DB is exported."""
+    try:
+        c = sqlite3.connect(f"{DB_PATH.as_uri()}?mode=ro", uri=True, check_same_thread=False)
+    except sqlite3.OperationalError:
+        return None
+    c.execute("PRAGMA query_only=1")
+    c.execute("PRAGMA mmap_size=268435456")
+    c.execute("PRAGMA cache_size=-65536")
+    return c
+
+
+@st.cache_data(ttl=300, show_spinner=False)
 def _query(sql: str, params: tuple = ()) -> pd.DataFrame:
-    with sqlite3.connect(DB_PATH) as c:
-        return pd.read_sql(sql, c, params=params if params else None)
+    return pd.read_sql(sql, _conn(), params=params if params else None)
 
 
-def _strip_diacritics(text: str) -> str:
-    if text is None or pd.isna(text):
-        return ""
-    normalized = unicodedata.normalize("NFKD", str(text))
-    without_marks = "".join(ch for ch in normalized if not unicodedata.combining(ch))
-    return re.sub(r"\s+", " ", without_marks).strip()
+@st.cache_data(ttl=300, show_spinner=False)
+def _fast_query(sql: str, params: tuple = ()) -> pd.DataFrame:
+    """Small result sets: plain fetchall skips read_sql's adapter and dtype inference."""
+    cur = _conn().execute(sql, params)
+    return pd.DataFrame.from_records(cur.fetchall(), columns=[d[0] for d in cur.description])
 
 
-def _clean_meaning(text: str) -> str:
-    if text is None or pd.isna(text):
-        return ""
-    clean = re.sub(r"^\s*\d+\.\d+\s*", "", str(text or ""))
-    return re.sub(r"\s+", " ", clean).strip()
+@st.cache_data(ttl=300, show_spinner=False)
+def _arrow_query(sql: str, params: tuple = ()) -> pa.Table:
+    """Display-only tables: rows go straight to Arrow, which st.dataframe ships as-is."""
+    cur = _conn().execute(sql, params)
+    cols = [d[0] for d in cur.description]
+    return pa.Table.from_pylist([dict(zip(cols, row)) for row in cur.fetchall()])
 
 
-st.set_page_config(page_title="Vedic Wisdom", page_icon="📿", layout="wide")
-st.title("📿 Vedic Wisdom")
-st.caption("Panchang, janam patri, and recommendation history from your metadata")
+# "This week" tables: kind → (latest-week view from export_to_sqlite, columns).
+# Fused into one UNION ALL so the page is a single SQLite round-trip.
+_WEEK_PARTS = {
+    "week": ("latest_week", ["week_start", "week_end"]),
+    "days": ("latest_week_days", ["date", "vaara", "tithi", "paksha", "nakshatra", "sunrise"]),
+    "obs": ("latest_week_obs", ["date", "name", "deity", "description"]),
+    "verses": ("latest_week_verses", ["date", "tithi", "paksha", "devanagari", "transliteration", "meaning", "source", "transliteration_plain", "meaning_clean"]),
+    "vo": ("latest_verse_of_week", ["devanagari", "transliteration", "meaning", "source", "transliteration_plain", "meaning_clean"]),
+}
+_WEEK_COLS = list(dict.fromkeys(c for _, cols in _WEEK_PARTS.values() for c in cols))
 
-if not DB_PATH.exists():
-    st.warning("No database yet. Run: `python scripts/export_to_sqlite.py`")
-    st.stop()
 
-page = st.sidebar.radio("Go to", ["This week", "Janam patri", "History", "Insights"], label_visibility="collapsed")
+def _week_select(kind: str, view: str, cols: list[str]) -> str:
+    fields = ", ".join(c if c in cols else f"NULL AS {c}" for c in _WEEK_COLS)
+    return f"SELECT '{kind}' AS kind, {fields} FROM {view}"
+
+
+_WEEK_SQL = " UNION ALL ".join(_week_select(k, v, cols) for k, (v, cols) in _WEEK_PARTS.items()) + " ORDER BY date"
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _load_week() -> dict[str, pd.DataFrame]:
+    """Latest week's tables from one tagged query, sliced per kind."""
+    df = _fast_query(_WEEK_SQL)
+    return {k: df.loc[df["kind"] == k, cols].reset_index(drop=True) for k, (_, cols) in _WEEK_PARTS.items()}
+
+
+def _verse_of_week(vo: pd.DataFrame) -> None:
+    if vo.empty:
+        return
+    st.subheader("Verse of the week")
+    r = vo.iloc[0]
+    st.write(f"Transliteration: {r['transliteration_plain'] or ''}")
+    st.caption(f"Meaning: {r['meaning_clean'] or ''}")
+    st.caption(f"Source: {r['source'] or ''}")
+
 
-if page == "This week":
+@st.fragment
+def _page_this_week() -> None:
     st.header("This week's panchang (EST)")
-    weeks = _query("SELECT week_start, week_end FROM weeks ORDER BY week_start DESC LIMIT 1")
-    if weeks.empty:
+    try:
+        week = _load_week()
+    except sqlite3.OperationalError:  # DB exported by an older export_to_sqlite.py
+        week = {"week": pd.DataFrame()}
+    if week["week"].empty:
         st.info("No week data. Run `python scripts/export_to_sqlite.py`.")
-    else:
-        w = weeks.iloc[0]
-        st.subheader(f"{w['week_start']} → {w['week_end']}")
-        days = _query("SELECT date, vaara, tithi, paksha, nakshatra, sunrise FROM panchang_days WHERE week_start = ?", (w["week_start"],))
-        if not days.empty:
-            st.dataframe(days, use_container_width=True, hide_index=True)
-        obs = _query("SELECT date, name, deity, description FROM observances WHERE week_start = ?", (w["week_start"],))
-        if not obs.empty:
-            st.subheader("Observances")
-            st.dataframe(obs, use_container_width=True, hide_index=True)
-        st.subheader("Shloka by tithi")
-        verses = _query("SELECT date, tithi, paksha, devanagari, transliteration, meaning, source FROM daily_verses WHERE week_start = ? ORDER BY date", (w["week_start"],))
-        for _, row in verses.iterrows():
-            with st.expander(f"{row['date']} — {row['paksha']} {row['tithi']}"):
-                if pd.notna(row["transliteration"]) or pd.notna(row["meaning"]):
-                    st.write(f"Transliteration: {_strip_diacritics(row['transliteration'])}")
-                    st.caption(f"Meaning: {_clean_meaning(row['meaning'])}")
-                    st.caption(f"Source: {row['source'] or ''}")
-        vo = _query("SELECT devanagari, transliteration, meaning, source FROM verse_of_week WHERE week_start = ?", (w["week_start"],))
-        if not vo.empty:
-            st.subheader("Verse of the week")
-            r = vo.iloc[0]
-            st.write(f"Transliteration: {_strip_diacritics(r['transliteration'])}")
-            st.caption(f"Meaning: {_clean_meaning(r['meaning'])}")
-            st.caption(f"Source: {r['source'] or ''}")
-
-elif page == "Janam patri":
+        return
+    w = week["week"].iloc[0]
+    st.subheader(f"{w['week_start']} → {w['week_end']}")
+    if not week["days"].empty:
+        st.dataframe(week["days"], use_container_width=True, hide_index=True)
+    if not week["obs"].empty:
+        st.subheader("Observances")
+        st.dataframe(week["obs"], use_container_width=True, hide_index=True)
+    st.subheader("Shloka by tithi")
+    for row in week["verses"].itertuples(index=False):
+        with st.expander(f"{row.date} — {row.paksha} {row.tithi}"):
+            if pd.notna(row.transliteration) or pd.notna(row.meaning):
+                st.write(f"Transliteration: {row.transliteration_plain or ''}")
+                st.caption(f"Meaning: {row.meaning_clean or ''}")
+                st.caption(f"Source: {row.source or ''}")
+    _verse_of_week(week["vo"])
+
+
+@st.fragment
+def _page_janam() -> None:
     st.header("Janam patri")
-    jp = _query("SELECT * FROM janam_patri LIMIT 1")
+    try:
+        jp = _fast_query("SELECT * FROM janam_patri LIMIT 1")
+        verses = _fast_query("SELECT source, transliteration_plain, meaning_clean FROM janam_patri_verses ORDER BY sort_order")
+    except sqlite3.OperationalError:  # DB exported by an older export_to_sqlite.py
+        jp = pd.DataFrame()
     if jp.empty:
         st.info("Janam patri not in DB. Enable in config and run `python scripts/export_to_sqlite.py`.")
-    else:
-        r = jp.iloc[0]
-        c1, c2, c3 = st.columns(3)
-        c1.metric("Janma Nakshatra", r["janma_nakshatra"])
-        c2.metric("Rashi", r["rashi"])
-        c3.metric("Birth", f"{r['birth_date']} {r['birth_time']}")
-        st.caption(f"Place: {r['birth_place']}")
-        verses = _query("SELECT devanagari, transliteration, meaning, source FROM janam_patri_verses ORDER BY sort_order")
-        if not verses.empty:
-            st.subheader("Recommended verses")
-            for idx, v in verses.iterrows():
-                st.markdown(f"**{idx + 1}. {v['source'] or 'Verse'}**")
-                st.write(f"Transliteration: {_strip_diacritics(v['transliteration'])}")
-                st.caption(f"Meaning: {_clean_meaning(v['meaning'])}")
-
-elif page == "History":
+        return
+    r = jp.iloc[0]
+    c1, c2, c3 = st.columns(3)
+    c1.metric("Janma Nakshatra", r["janma_nakshatra"])
+    c2.metric("Rashi", r["rashi"])
+    c3.metric("Birth", f"{r['birth_date']} {r['birth_time']}")
+    st.caption(f"Place: {r['birth_place']}")
+    if not verses.empty:
+        st.subheader("Recommended verses")
+        for idx, v in enumerate(verses.itertuples(index=False), start=1):
+            st.markdown(f"**{idx}. {v.source or 'Verse'}**")
+            st.write(f"Transliteration: {v.transliteration_plain or ''}")
+            st.caption(f"Meaning: {v.meaning_clean or ''}")
+
+
+@st.fragment
+def _page_history() -> None:
     st.header("Recommendation history")
-    runs = _query("SELECT week_start AS week, verse_source, observances, observance_count, search_latency_ms, start_time FROM runs ORDER BY start_time DESC")
-    if runs.empty:
+    runs = _arrow_query("SELECT week_start AS week, verse_source, observances, observance_count, search_latency_ms, start_time FROM runs ORDER BY start_time DESC")
+    if not runs.num_rows:
         st.info("No runs yet.")
     else:
         st.dataframe(runs, use_container_width=True, hide_index=True)
 
-else:
+
+@st.fragment
+def _page_insights() -> None:
     st.header("Insights")
-    runs = _query("SELECT week_start, verse_source, observance_count, observances FROM runs")
-    if runs.empty:
+    stats = _fast_query(
+        "SELECT COUNT(*) AS weeks, COALESCE(SUM(observance_count), 0) AS total_obs, "
+        "(SELECT verse_source FROM runs WHERE verse_source IS NOT NULL GROUP BY verse_source ORDER BY COUNT(*) DESC LIMIT 1) AS top_source "
+        "FROM runs"
+    ).iloc[0]
+    if not stats["weeks"]:
         st.info("No runs yet. Generate weekly digests and export to SQLite.")
-    else:
-        col1, col2, col3 = st.columns(3)
-        col1.metric("Weeks tracked", len(runs))
-        col2.metric("Total observances", int(runs["observance_count"].sum()))
-        top = runs["verse_source"].value_counts()
-        if not top.empty:
-            col3.metric("Most recommended", top.index[0])
-        st.subheader("Observance count by week")
-        st.bar_chart(runs.set_index("week_start")[["observance_count"]])
+        return
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Weeks tracked", int(stats["weeks"]))
+    col2.metric("Total observances", int(stats["total_obs"]))
+    if stats["top_source"] is not None:
+        col3.metric("Most recommended", stats["top_source"])
+    st.subheader("Observance count by week")
+    runs = _query("SELECT week_start, observance_count FROM runs ORDER BY week_start")
+    st.bar_chart(runs.set_index("week_start")[["observance_count"]])
+
+
+PAGES = {"This week": _page_this_week, "Janam patri": _page_janam, "History": _page_history, "Insights": _page_insights}
+
+st.set_page_config(page_title="Vedic Wisdom", page_icon="📿", layout="wide")
+st.title("📿 Vedic Wisdom")
+st.caption("Panchang, janam patri, and recommendation history from your metadata")
+
+if _conn() is None:
+    _conn.clear()  # don't cache the miss — retry once the export has run
+    st.warning("No database yet. Run: `python scripts/export_to_sqlite.py`")
+    st.stop()
+
+page = st.sidebar.radio("Go to", list(PAGES), label_visibility="collapsed")
+PAGES[page]()
@@ -3,18 +3,51 @@ from __future__ import annotations
 
 import os
 import sys
+import unicodedata
 from pathlib import Path
 
 DASHBOARD_DATA = Path(__file__).resolve().parent.parent / "dashboard" / "data"
 DB_PATH = DASHBOARD_DATA / "vedic_wisdom.db"
 TRACKING_URI = os.getenv("MLFLOW_TRACKING_URI", "sqlite:///mlflow.db")
 EXPERIMENT_NAME = "vedic-wisdom-weekly"
+RUNS_PAGE_SIZE = 1000
+
+# Display-ready text computed once at export so the dashboard only SELECTs it.
+NORMALIZED_COLUMNS = ("transliteration_plain", "meaning_clean")
+VERSE_TABLES = ("daily_verses", "verse_of_week", "janam_patri_verses")
 
 
 def _get_conn():
     import sqlite3
     DASHBOARD_DATA.mkdir(parents=True, exist_ok=True)
-    return sqlite3.connect(DB_PATH)
+    conn = sqlite3.connect(DB_PATH)
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def _add_missing_columns(conn) -> None:
+    """Upgrade DBs created before the normalized columns existed."""
+    for table in VERSE_TABLES:
+        have = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        for col in (c for c in NORMALIZED_COLUMNS if c not in have):
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {col} TEXT")
+
+
+def _nfc(text: str | None) -> str | None:
+    return unicodedata.normalize("NFC", text) if text else text
+
+
+def _verse_cols(v: dict) -> tuple:
+    """(devanagari, transliteration, meaning, source, transliteration_plain, meaning_clean) for a verse dict.
+
+    Verse text is stored NFC so equal strings compare equal in SQL and readers never re-normalize.
+    """
+    from janam_patri import _strip_diacritics, _clean_meaning
+    devanagari, transliteration, meaning = (_nfc(v.get(k)) for k in ("devanagari", "transliteration", "meaning"))
+    return (
+        devanagari, transliteration, meaning, v.get("source"),
+        _strip_diacritics(transliteration), _clean_meaning(meaning),
+    )
 
 
 def init_schema(conn) -> None:
@@ -59,14 +92,18 @@ def init_schema(conn) -> None:
         devanagari TEXT,
         transliteration TEXT,
         meaning TEXT,
-        source TEXT
+        source TEXT,
+        transliteration_plain TEXT,
+        meaning_clean TEXT
     );
     CREATE TABLE IF NOT EXISTS verse_of_week (
         week_start TEXT PRIMARY KEY,
         devanagari TEXT,
         transliteration TEXT,
         meaning TEXT,
-        source TEXT
+        source TEXT,
+        transliteration_plain TEXT,
+        meaning_clean TEXT
     );
     CREATE TABLE IF NOT EXISTS janam_patri (
         birth_date TEXT,
@@ -83,9 +120,26 @@ def init_schema(conn) -> None:
         transliteration TEXT,
         meaning TEXT,
         source TEXT,
-        sort_order INTEGER
+        sort_order INTEGER,
+        transliteration_plain TEXT,
+        meaning_clean TEXT
     );
+    CREATE INDEX IF NOT EXISTS ix_obs_week ON observances(week_start);
+    CREATE INDEX IF NOT EXISTS ix_dv_week ON daily_verses(week_start);
+    CREATE INDEX IF NOT EXISTS ix_runs_start ON runs(start_time DESC);
+    CREATE INDEX IF NOT EXISTS ix_jpv_sort ON janam_patri_verses(sort_order);
+    CREATE VIEW IF NOT EXISTS latest_week AS
+        SELECT week_start, week_end FROM weeks ORDER BY week_start DESC LIMIT 1;
+    CREATE VIEW IF NOT EXISTS latest_week_days AS
+        SELECT p.* FROM panchang_days p JOIN latest_week USING (week_start);
+    CREATE VIEW IF NOT EXISTS latest_week_obs AS
+        SELECT o.* FROM observances o JOIN latest_week USING (week_start);
+    CREATE VIEW IF NOT EXISTS latest_week_verses AS
+        SELECT v.* FROM daily_verses v JOIN latest_week USING (week_start);
+    CREATE VIEW IF NOT EXISTS latest_verse_of_week AS
+        SELECT v.* FROM verse_of_week v JOIN latest_week USING (week_start);
     """)
+    _add_missing_columns(conn)
 
 
 def export_mlflow_runs(conn) -> int:
@@ -100,27 +154,44 @@ def export_mlflow_runs(conn) -> int:
         return 0
     if not exp:
         return 0
-    runs = client.search_runs(experiment_ids=[exp.experiment_id], order_by=["start_time DESC"])
     cur = conn.cursor()
     cur.execute("DELETE FROM runs")
-    for run in runs:
-        p = run.data.params or {}
-        m = run.data.metrics or {}
-        cur.execute(
+    total = 0
+    for page in _run_pages(client, exp.experiment_id):
+        cur.executemany(
             "INSERT OR REPLACE INTO runs (run_id, week_start, verse_id, verse_source, observances, observance_count, search_latency_ms, start_time) VALUES (?,?,?,?,?,?,?,?)",
-            (
-                run.info.run_id,
-                p.get("week", ""),
-                p.get("verse_id", ""),
-                p.get("verse_source", ""),
-                p.get("observances", ""),
-                int(m.get("observance_count", 0)),
-                float(m.get("search_latency_ms", 0)),
-                str(run.info.start_time) if run.info.start_time else None,
-            ),
+            map(_run_row, page),
+        )
+        total += len(page)
+    return total
+
+
+def _run_pages(client, experiment_id: str):
+    """Yield search_runs pages so only one page of runs is in memory at a time."""
+    token = None
+    while True:
+        page = client.search_runs(
+            experiment_ids=[experiment_id], order_by=["start_time DESC"], max_results=RUNS_PAGE_SIZE, page_token=token,
         )
-    conn.commit()
-    return len(runs)
+        yield page
+        token = page.token
+        if not token:
+            return
+
+
+def _run_row(run) -> tuple:
+    p = run.data.params or {}
+    m = run.data.metrics or {}
+    return (
+        run.info.run_id,
+        p.get("week", ""),
+        p.get("verse_id", ""),
+        p.get("verse_source", ""),
+        p.get("observances", ""),
+        int(m.get("observance_count", 0)),
+        float(m.get("search_latency_ms", 0)),
+        str(run.info.start_time) if run.info.start_time else None,
+    )
 
 
 def export_current_digest(conn) -> None:
@@ -131,28 +202,28 @@ def export_current_digest(conn) -> None:
     days, chart, loc = build_week(dt.date.today(), write_history=False)
     d = week_to_dict(days, chart, loc)
     cur = conn.cursor()
-    from datetime import datetime
-    now = datetime.utcnow().isoformat() + "Z"
+    now = dt.datetime.utcnow().isoformat() + "Z"
     cur.execute("INSERT OR REPLACE INTO weeks (week_start, week_end, exported_at) VALUES (?,?,?)", (d["week_start"], d["week_end"], now))
     cur.execute("DELETE FROM panchang_days WHERE week_start = ?", (d["week_start"],))
-    for p in d.get("panchang_days", []):
-        cur.execute(
-            "INSERT INTO panchang_days (week_start, date, vaara, tithi, paksha, nakshatra, sunrise) VALUES (?,?,?,?,?,?,?)",
-            (d["week_start"], p["date"], p["vaara"], p["tithi"], p["paksha"], p["nakshatra"], p["sunrise"]),
-        )
+    cur.executemany(
+        "INSERT INTO panchang_days (week_start, date, vaara, tithi, paksha, nakshatra, sunrise) VALUES (?,?,?,?,?,?,?)",
+        ((d["week_start"], p["date"], p["vaara"], p["tithi"], p["paksha"], p["nakshatra"], p["sunrise"]) for p in d.get("panchang_days", [])),
+    )
     cur.execute("DELETE FROM observances WHERE week_start = ?", (d["week_start"],))
-    for o in d.get("observances", []):
-        cur.execute("INSERT INTO observances (week_start, date, name, deity, description) VALUES (?,?,?,?,?)", (d["week_start"], o["date"], o["name"], o["deity"], o["description"]))
+    cur.executemany(
+        "INSERT INTO observances (week_start, date, name, deity, description) VALUES (?,?,?,?,?)",
+        ((d["week_start"], o["date"], o["name"], o["deity"], o["description"]) for o in d.get("observances", [])),
+    )
     cur.execute("DELETE FROM daily_verses WHERE week_start = ?", (d["week_start"],))
-    for v in d.get("daily_verses", []):
-        verse = v.get("verse") or {}
-        cur.execute(
-            "INSERT INTO daily_verses (week_start, date, tithi, paksha, devanagari, transliteration, meaning, source) VALUES (?,?,?,?,?,?,?,?)",
-            (d["week_start"], v["date"], v["tithi"], v["paksha"], verse.get("devanagari"), verse.get("transliteration"), verse.get("meaning"), verse.get("source")),
-        )
+    cur.executemany(
+        "INSERT INTO daily_verses (week_start, date, tithi, paksha, devanagari, transliteration, meaning, source, transliteration_plain, meaning_clean) VALUES (?,?,?,?,?,?,?,?,?,?)",
+        ((d["week_start"], v["date"], v["tithi"], v["paksha"], *_verse_cols(v.get("verse") or {})) for v in d.get("daily_verses", [])),
+    )
     vo = d.get("verse_of_week") or {}
-    cur.execute("INSERT OR REPLACE INTO verse_of_week (week_start, devanagari, transliteration, meaning, source) VALUES (?,?,?,?,?)", (d["week_start"], vo.get("devanagari"), vo.get("transliteration"), vo.get("meaning"), vo.get("source")))
-    conn.commit()
+    cur.execute(
+        "INSERT OR REPLACE INTO verse_of_week (week_start, devanagari, transliteration, meaning, source, transliteration_plain, meaning_clean) VALUES (?,?,?,?,?,?,?)",
+        (d["week_start"], *_verse_cols(vo)),
+    )
 
 
 def export_janam_patri(conn) -> bool:
@@ -172,18 +243,20 @@ def export_janam_patri(conn) -> bool:
         (data["birth_date"], data["birth_time"], data.get("birth_place"), data["janma_nakshatra"], data["rashi"], data["theme"], now),
     )
     cur.execute("DELETE FROM janam_patri_verses")
-    for i, v in enumerate(data.get("verses", [])):
-        cur.execute("INSERT INTO janam_patri_verses (devanagari, transliteration, meaning, source, sort_order) VALUES (?,?,?,?,?)", (v["devanagari"], v["transliteration"], v["meaning"], v["source"], i))
-    conn.commit()
+    cur.executemany(
+        "INSERT INTO janam_patri_verses (devanagari, transliteration, meaning, source, transliteration_plain, meaning_clean, sort_order) VALUES (?,?,?,?,?,?,?)",
+        ((*_verse_cols(v), i) for i, v in enumerate(data.get("verses", []))),
+    )
     return True
 
 
 def main() -> None:
     conn = _get_conn()
-    init_schema(conn)
-    n = export_mlflow_runs(conn)
-    export_current_digest(conn)
-    jp = export_janam_patri(conn)
+    with conn:  # one transaction for the whole export
+        init_schema(conn)
+        n = export_mlflow_runs(conn)
+        export_current_digest(conn)
+        jp = export_janam_patri(conn)
     conn.close()
     print(f"SQLite: {DB_PATH}")
     print(f"  runs: {n} | current week panchang: written | janam_patri: {'yes' if jp else 'no'}")
@@ -0,0 +1,56 @@
+"""Retry transient webhook / API failures (429, 5xx, connection errors) with exponential backoff.
+
+Idempotent methods retry on any RETRY_STATUSES code or transport error. Other methods
+(the Slack webhook and Supermemory POSTs) retry only when the server cannot have acted on
+the request, so a 5xx sent back after the write was accepted never double-posts.
+"""
+from __future__ import annotations
+
+import random
+import time
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Rate-limited / unavailable: the request was not processed, so resending a POST is safe
+UNPROCESSED_STATUSES = frozenset({429, 503})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+MAX_ATTEMPTS = 3
+MAX_DELAY = 30.0  # seconds
+
+
+def _backoff(attempt: int) -> float:
+    return 0.5 * 2 ** attempt + random.random() * 0.1
+
+
+def _retry_delay(resp, attempt: int) -> float:
+    """Honour a numeric Retry-After header, else back off exponentially with jitter."""
+    retry_after = resp.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return min(float(retry_after), MAX_DELAY)
+    return _backoff(attempt)
+
+
+def _retry_policy(method: str) -> tuple[frozenset[int], tuple[type[Exception], ...]]:
+    """(statuses, exceptions) that are safe to retry for this method."""
+    import httpx
+    if method.upper() in IDEMPOTENT_METHODS:
+        return RETRY_STATUSES, (httpx.TransportError,)
+    return UNPROCESSED_STATUSES, (httpx.ConnectError, httpx.ConnectTimeout)
+
+
+def request_with_retry(client, method: str, url: str, **kwargs):
+    """Send via client, retrying only what _retry_policy allows; raises on final failure."""
+    statuses, errors = _retry_policy(method)
+    for attempt in range(MAX_ATTEMPTS):
+        last = attempt == MAX_ATTEMPTS - 1
+        try:
+            resp = client.request(method, url, **kwargs)
+        except errors:
+            if last:
+                raise
+            time.sleep(_backoff(attempt))
+            continue
+        if resp.status_code not in statuses or last:
+            break
+        time.sleep(_retry_delay(resp, attempt))
+    resp.raise_for_status()
+    return resp
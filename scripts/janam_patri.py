@@ -11,10 +11,10 @@ import sys
 import os
 import unicodedata
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
-import swisseph as swe
-import yaml
+_VERSE_SEARCH_DIR = Path(__file__).resolve().parent.parent / "skills" / "sanskrit-wisdom" / "scripts"
 
 # Panchang nakshatra names
 NAKSHATRA_NAMES = [
@@ -71,7 +71,7 @@ NAKSHATRA_LIFESTYLE = {
 }
 
 
-@dataclass
+@dataclass(frozen=True)
 class BirthChart:
     janma_nakshatra: str
     rashi: str
@@ -81,18 +81,24 @@ class BirthChart:
 
 def _jd_ut(year: int, month: int, day: int, hour: float) -> float:
     """Julian day at given UT (hour as fractional 0-24)."""
+    import swisseph as swe
     return swe.julday(year, month, day, hour)
 
 
 def _sidereal_moon_longitude(jd_ut: float) -> float:
     """Moon longitude in sidereal (Lahiri ayanamsha), 0–360."""
+    import swisseph as swe
     moon_tropical = swe.calc_ut(jd_ut, swe.MOON)[0][0]
     ayan = swe.get_ayanamsa_ut(jd_ut)
     return (moon_tropical - ayan) % 360
 
 
+@lru_cache(maxsize=16)
 def compute_birth_chart(birth_date: str, birth_time: str, tz_offset: float) -> BirthChart:
-    """Compute janma nakshatra and rashi from birth date/time (local) and timezone."""
+    """Compute janma nakshatra and rashi from birth date/time (local) and timezone.
+
+    Birth details are fixed per user, so the ephemeris work is memoized.
+    """
     # Parse date YYYY-MM-DD and time HH:MM
     y, m, d = (int(x) for x in birth_date.split("-"))
     parts = birth_time.replace(":", " ").split()
@@ -114,6 +120,7 @@ def compute_birth_chart(birth_date: str, birth_time: str, tz_offset: float) -> B
 
 def load_janam_config(config_path: Path) -> dict | None:
     """Load config; return janam_patri section if enabled."""
+    import yaml
     if os.getenv("VEDIC_CONFIG_YAML"):
         cfg = yaml.safe_load(os.environ["VEDIC_CONFIG_YAML"])
     else:
@@ -125,12 +132,15 @@ def load_janam_config(config_path: Path) -> dict | None:
     return jp if (jp and jp.get("enabled")) else None
 
 
-def recommend_verses(theme: str, top_k: int = 5) -> list:
-    """Return recommended verses for a search theme (deity/theme string)."""
-    _verse_dir = Path(__file__).resolve().parent.parent / "skills" / "sanskrit-wisdom" / "scripts"
-    sys.path.insert(0, str(_verse_dir))
+@lru_cache(maxsize=64)
+def recommend_verses(theme: str, top_k: int = 5) -> tuple:
+    """Return recommended verses for a search theme (deity/theme string); memoized per process."""
+    # Imported here so importers that only need the text helpers never load verse_search
+    if str(_VERSE_SEARCH_DIR) not in sys.path:
+        sys.path.insert(0, str(_VERSE_SEARCH_DIR))
     from verse_search import search
-    return search(theme, top_k=top_k)
+
+    return tuple(search(theme, top_k=top_k))
 
 
 def run_to_dict(config_path: Path | None = None) -> dict | None:
@@ -184,19 +194,33 @@ def run_to_dict(config_path: Path | None = None) -> dict | None:
     }
 
 
+_WS_RE = re.compile(r"\s+")
+_VERSE_PREFIX_RE = re.compile(r"^\s*\d+\.\d+\s*")
+# IAST letters → their NFKD base letter, applied in one C-level str.translate pass
+_IAST_CHARS = "āīūṛṝḷḹṅñṭḍṇśṣḥṃṁēō"
+_IAST_TO_ASCII = str.maketrans({c: unicodedata.normalize("NFKD", c)[0] for c in _IAST_CHARS + _IAST_CHARS.upper()})
+
+
+@lru_cache(maxsize=1)
+def _combining_table() -> dict[int, None]:
+    """str.translate table deleting every combining mark; built on first non-IAST input."""
+    return dict.fromkeys(cp for cp in range(sys.maxunicode + 1) if unicodedata.combining(chr(cp)))
+
+
 def _strip_diacritics(text: str) -> str:
     """Convert transliteration with diacritics to plain ASCII-style text."""
     if not text:
         return ""
-    normalized = unicodedata.normalize("NFKD", text)
-    without_marks = "".join(ch for ch in normalized if not unicodedata.combining(ch))
-    return re.sub(r"\s+", " ", without_marks.replace("\n", " ")).strip()
+    text = text.translate(_IAST_TO_ASCII)
+    if not text.isascii():  # anything outside IAST still goes through NFKD
+        text = unicodedata.normalize("NFKD", text).translate(_combining_table())
+    return _WS_RE.sub(" ", text).strip()
 
 
 def _clean_meaning(text: str) -> str:
     """Normalize spacing and drop duplicated verse prefixes like '7.3 '."""
-    clean = re.sub(r"^\s*\d+\.\d+\s*", "", text or "")
-    return re.sub(r"\s+", " ", clean).strip()
+    clean = _VERSE_PREFIX_RE.sub("", text or "")
+    return _WS_RE.sub(" ", clean).strip()
 
 
 def run(config_path: Path | None = None) -> str:
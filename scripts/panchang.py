@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import datetime as dt
 from dataclasses import dataclass
+from functools import lru_cache
 
 import swisseph as swe
 
@@ -20,47 +21,59 @@ DEFAULT_LAT = 40.7128
 DEFAULT_LON = -74.2060
 DEFAULT_TZ = -5.0  # EST
 
-TITHI_NAMES = [
+# Longitude only: skip the FLG_SPEED derivative pass calc_ut does by default
+_CALC_FLAGS = swe.FLG_SWIEPH
+
+TITHI_NAMES = (
     "Pratipada", "Dwitiya", "Tritiya", "Chaturthi", "Panchami",
     "Shashthi", "Saptami", "Ashtami", "Navami", "Dashami",
     "Ekadashi", "Dwadashi", "Trayodashi", "Chaturdashi", "Purnima",
     "Pratipada", "Dwitiya", "Tritiya", "Chaturthi", "Panchami",
     "Shashthi", "Saptami", "Ashtami", "Navami", "Dashami",
     "Ekadashi", "Dwadashi", "Trayodashi", "Chaturdashi", "Amavasya",
-]
+)
 
-NAKSHATRA_NAMES = [
+NAKSHATRA_NAMES = (
     "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira",
     "Ardra", "Punarvasu", "Pushya", "Ashlesha", "Magha",
     "Purva Phalguni", "Uttara Phalguni", "Hasta", "Chitra", "Swati",
     "Vishakha", "Anuradha", "Jyeshtha", "Mula", "Purva Ashadha",
     "Uttara Ashadha", "Shravana", "Dhanishta", "Shatabhisha",
     "Purva Bhadrapada", "Uttara Bhadrapada", "Revati",
-]
+)
 
-YOGA_NAMES = [
+YOGA_NAMES = (
     "Vishkambha", "Priti", "Ayushman", "Saubhagya", "Shobhana",
     "Atiganda", "Sukarma", "Dhriti", "Shula", "Ganda",
     "Vriddhi", "Dhruva", "Vyaghata", "Harshana", "Vajra",
     "Siddhi", "Vyatipata", "Variyan", "Parigha", "Shiva",
     "Siddha", "Sadhya", "Shubha", "Shukla", "Brahma",
     "Indra", "Vaidhriti",
-]
+)
 
-KARANA_NAMES = [
+KARANA_NAMES = (
     "Bava", "Balava", "Kaulava", "Taitila", "Garaja",
     "Vanija", "Vishti", "Shakuni", "Chatushpada", "Nagava", "Kimstughna",
-]
+)
+
+# Arc widths (degrees) of one tithi, karana, nakshatra and yoga
+_TITHI_WIDTH = 12.0
+_KARANA_WIDTH = 6.0
+_NAK_WIDTH = _YOGA_WIDTH = 360 / 27
 
-VAARA_NAMES = ["Ravivara", "Somavara", "Mangalavara", "Budhavara", "Guruvara", "Shukravara", "Shanivara"]
+# Map the 60 half-tithis to the 11 named karanas:
+# Kimstughna, 8 cycles of the 7 movable karanas, Shakuni, Chatushpada, Nagava
+_KARANA_LUT = (10,) + tuple((k - 1) % 7 for k in range(1, 57)) + (7, 8, 9)
 
-PAKSHA_NAMES = ["Shukla", "Krishna"]
+VAARA_NAMES = ("Ravivara", "Somavara", "Mangalavara", "Budhavara", "Guruvara", "Shukravara", "Shanivara")
 
-MASA_NAMES = [
+PAKSHA_NAMES = ("Shukla", "Krishna")
+
+MASA_NAMES = (
     "Chaitra", "Vaishakha", "Jyeshtha", "Ashadha", "Shravana",
     "Bhadrapada", "Ashwina", "Kartika", "Margashira", "Pushya",
     "Magha", "Phalguna",
-]
+)
 
 
 # ── Core Calculations ────────────────────────────────────────────────
@@ -70,14 +83,26 @@ def _jd(date: dt.date) -> float:
     return swe.julday(date.year, date.month, date.day, 0.0)
 
 
+@lru_cache(maxsize=4096)
+def _calc_lon(jd: float, body: int) -> float:
+    """Tropical longitude of a body in degrees, memoized per (jd, body)."""
+    return swe.calc_ut(jd, body, _CALC_FLAGS)[0][0]
+
+
 def _sun_lon(jd: float) -> float:
     """Tropical longitude of the Sun in degrees."""
-    return swe.calc_ut(jd, swe.SUN)[0][0]
+    return _calc_lon(jd, swe.SUN)
 
 
 def _moon_lon(jd: float) -> float:
     """Tropical longitude of the Moon in degrees."""
-    return swe.calc_ut(jd, swe.MOON)[0][0]
+    return _calc_lon(jd, swe.MOON)
+
+
+@lru_cache(maxsize=4096)
+def _ayanamsa(jd: float) -> float:
+    """Ayanamsha in degrees, memoized per jd."""
+    return swe.get_ayanamsa_ut(jd)
 
 
 def _sunrise_jd(jd: float, lat: float = DEFAULT_LAT, lon: float = DEFAULT_LON) -> float:
@@ -86,52 +111,59 @@ def _sunrise_jd(jd: float, lat: float = DEFAULT_LAT, lon: float = DEFAULT_LON) -
     return result[1][0]
 
 
+def _tithi(sun: float, moon: float) -> int:
+    """Tithi number (0-29) from tropical Sun/Moon longitudes."""
+    return int(((moon - sun) % 360) / _TITHI_WIDTH)
+
+
+def _nakshatra(moon: float, ayan: float) -> int:
+    """Nakshatra number (0-26) from the Moon's longitude and ayanamsha."""
+    sidereal = (moon - ayan) % 360
+    return int(sidereal / _NAK_WIDTH)
+
+
+def _yoga(sun: float, moon: float, ayan: float) -> int:
+    """Yoga number (0-26) from Sun/Moon longitudes and ayanamsha."""
+    sid_sun = (sun - ayan) % 360
+    sid_moon = (moon - ayan) % 360
+    total = (sid_sun + sid_moon) % 360
+    return int(total / _YOGA_WIDTH)
+
+
+def _karana(sun: float, moon: float) -> int:
+    """Karana number (0-10) from tropical Sun/Moon longitudes."""
+    return _KARANA_LUT[int(((moon - sun) % 360) / _KARANA_WIDTH) % 60]
+
+
+def _limbs(sun: float, moon: float, ayan: float) -> tuple[int, int, int, int]:
+    """Tithi, nakshatra, yoga and karana from one set of sunrise longitudes."""
+    return _tithi(sun, moon), _nakshatra(moon, ayan), _yoga(sun, moon, ayan), _karana(sun, moon)
+
+
 def _tithi_at(jd: float) -> int:
     """Tithi number (0-29) at the given Julian day."""
-    sun, moon = _sun_lon(jd), _moon_lon(jd)
-    diff = (moon - sun) % 360
-    return int(diff / 12)
+    return _tithi(_sun_lon(jd), _moon_lon(jd))
 
 
 def _nakshatra_at(jd: float) -> int:
     """Nakshatra number (0-26) at the given Julian day."""
-    moon = _moon_lon(jd)
     # Ayanamsha correction (Lahiri)
-    ayan = swe.get_ayanamsa_ut(jd)
-    sidereal = (moon - ayan) % 360
-    return int(sidereal / (360 / 27))
+    return _nakshatra(_moon_lon(jd), _ayanamsa(jd))
 
 
 def _yoga_at(jd: float) -> int:
     """Yoga number (0-26) at the given Julian day."""
-    sun, moon = _sun_lon(jd), _moon_lon(jd)
-    ayan = swe.get_ayanamsa_ut(jd)
-    sid_sun = (sun - ayan) % 360
-    sid_moon = (moon - ayan) % 360
-    total = (sid_sun + sid_moon) % 360
-    return int(total / (360 / 27))
+    return _yoga(_sun_lon(jd), _moon_lon(jd), _ayanamsa(jd))
 
 
 def _karana_at(jd: float) -> int:
     """Karana number (0-10) at the given Julian day."""
-    sun, moon = _sun_lon(jd), _moon_lon(jd)
-    diff = (moon - sun) % 360
-    karana_num = int(diff / 6) % 60
-    # Map 60 karanas to the 11 named ones
-    if karana_num == 0:
-        return 10  # Kimstughna
-    if karana_num == 57:
-        return 7   # Shakuni
-    if karana_num == 58:
-        return 8   # Chatushpada
-    if karana_num == 59:
-        return 9   # Nagava
-    return (karana_num - 1) % 7
+    return _karana(_sun_lon(jd), _moon_lon(jd))
 
 
 # ── Public API ───────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DailyPanchang:
     date: dt.date
     vaara: str
@@ -144,16 +176,18 @@ class DailyPanchang:
     sunrise: str  # HH:MM format in local time
 
 
+@lru_cache(maxsize=1024)
 def compute(date: dt.date, lat: float = DEFAULT_LAT, lon: float = DEFAULT_LON, tz: float = DEFAULT_TZ) -> DailyPanchang:
     """Compute panchangam for a given date and location."""
     jd = _jd(date)
     sunrise_jd = _sunrise_jd(jd, lat, lon)
 
-    tithi_num = _tithi_at(sunrise_jd)
-    paksha = PAKSHA_NAMES[0] if tithi_num < 15 else PAKSHA_NAMES[1]
-    nak_num = _nakshatra_at(sunrise_jd)
-    yoga_num = _yoga_at(sunrise_jd)
-    karana_num = _karana_at(sunrise_jd)
+    # One ephemeris pass at sunrise, shared by every limb
+    sun, moon = _sun_lon(sunrise_jd), _moon_lon(sunrise_jd)
+    ayan = _ayanamsa(sunrise_jd)
+
+    tithi_num, nak_num, yoga_num, karana_num = _limbs(sun, moon, ayan)
+    paksha = PAKSHA_NAMES[tithi_num // 15]
     vaara_num = int((jd + 1.5) % 7)
 
     # Sunrise time in local HH:MM — convert JD(UT) to local hours
@@ -174,6 +208,11 @@ def compute(date: dt.date, lat: float = DEFAULT_LAT, lon: float = DEFAULT_LON, t
     )
 
 
+def compute_range(start: dt.date, n: int, lat: float = DEFAULT_LAT, lon: float = DEFAULT_LON, tz: float = DEFAULT_TZ) -> list[DailyPanchang]:
+    """Compute panchangam for n consecutive days starting at start."""
+    return [compute(start + dt.timedelta(days=i), lat, lon, tz) for i in range(n)]
+
+
 def is_ekadashi(p: DailyPanchang) -> bool:
     return p.tithi == "Ekadashi"
 
@@ -195,8 +234,5 @@ def is_chaturthi(p: DailyPanchang) -> bool:
 
 
 if __name__ == "__main__":
-    today = dt.date.today()
-    for offset in range(7):
-        day = today + dt.timedelta(days=offset)
-        p = compute(day)
+    for p in compute_range(dt.date.today(), 7):
         print(f"{p.date} ({p.vaara}) | {p.paksha} {p.tithi} | {p.nakshatra} | {p.yoga} | Sunrise {p.sunrise}")
@@ -13,7 +13,7 @@ PORT = int(os.getenv("DASHBOARD_PORT", "8080"))
 def main() -> None:
     os.chdir(DASHBOARD_DIR)
     handler = http.server.SimpleHTTPRequestHandler
-    with http.server.HTTPServer(("", PORT), handler) as httpd:
+    with http.server.ThreadingHTTPServer(("", PORT), handler) as httpd:
         url = f"http://localhost:{PORT}/"
         print(f"Serving dashboard at {url}")
         print("Press Ctrl+C to stop.")
@@ -1,17 +1,45 @@
 """Slack notification — send compact weekly digest + janam patri via webhook."""
 from __future__ import annotations
 
+import atexit
+import datetime as dt
+import hashlib
 import os
 import re
+import sys
+import time
+from functools import lru_cache
 from pathlib import Path
 
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT / "scripts") not in sys.path:
+    sys.path.insert(0, str(ROOT / "scripts"))
+
+from http_retry import request_with_retry
+from janam_patri import run_to_dict
+from weekly_guidance import HISTORY_PATH, VERSES_PATH, build_week, week_to_dict
+
 SLACK_WEBHOOK_URL = os.getenv("SLACK_WEBHOOK_URL", "")
 SLACK_MEMBER_ID = os.getenv("SLACK_MEMBER_ID", "")
 SLACK_MENTION = os.getenv("SLACK_MENTION", "")
+DIGEST_CACHE_DIR = Path.home() / ".cache" / "vedic-wisdom"
+WEEKLY_CACHE_TTL = int(os.getenv("WEEKLY_CACHE_TTL", "21600"))  # seconds
 
 EN_DAY = {"Ravivara":"Sun","Somavara":"Mon","Mangalavara":"Tue","Budhavara":"Wed",
           "Guruvara":"Thu","Shukravara":"Fri","Shanivara":"Sat"}
 
+_WS_RE = re.compile(r"\s+")
+_VERSE_PREFIX_RE = re.compile(r"^\s*\d+\.\d+\s*")
+
+
+@lru_cache(maxsize=1)
+def _client():
+    """Shared httpx.Client so repeated posts reuse the TCP/TLS connection."""
+    import httpx
+    client = httpx.Client(timeout=30)
+    atexit.register(client.close)
+    return client
+
 
 def _dashboard_url() -> str:
     return os.getenv("DASHBOARD_URL", "")
@@ -19,8 +47,8 @@ def _dashboard_url() -> str:
 
 def _clean_meaning(text: str) -> str:
     """Normalize spacing and drop duplicated verse prefixes like '7.3 '."""
-    clean = re.sub(r"^\s*\d+\.\d+\s*", "", text or "")
-    return re.sub(r"\s+", " ", clean).strip()
+    clean = _VERSE_PREFIX_RE.sub("", text or "")
+    return _WS_RE.sub(" ", clean).strip()
 
 
 def _compact_verse_line(v: dict | None) -> str:
@@ -85,35 +113,43 @@ def _overview_lines(days: list) -> list[str]:
 
 def _weekly_block() -> str:
     """Compact weekly block from the canonical weekly guidance engine."""
-    import sys
-    sys.path.insert(0, str(Path(__file__).resolve().parent))
-    from weekly_guidance import build_week, week_to_dict
-    import datetime as dt
-
     days, chart, loc = build_week(dt.date.today(), write_history=False)
     digest = week_to_dict(days, chart, loc)
-    lines = _header_lines(digest, chart, loc) + _overview_lines(days)
-    lines += ["", "Daily Panchang + Score", *[_day_line(day) for day in days]]
-    lines += [
-        "",
-        "Shloka of the Week",
-        _compact_verse_line(digest["verse_of_week"]),
-    ]
-    lines += [
-        "",
-        "Practice Guidance",
-        *[_practice_line(day) for day in days],
+    lines = [
+        *_header_lines(digest, chart, loc),
+        *_overview_lines(days),
+        "", "Daily Panchang + Score", *map(_day_line, days),
+        "", "Shloka of the Week", _compact_verse_line(digest["verse_of_week"]),
+        "", "Practice Guidance", *map(_practice_line, days),
     ]
     return "\n".join(lines)
 
 
+def _digest_cache_path() -> Path:
+    """Cache file keyed by today's date plus everything the weekly block reads."""
+    inputs = (ROOT / "config.yaml", HISTORY_PATH, VERSES_PATH)
+    stamps = [str(p.stat().st_mtime_ns) if p.exists() else "-" for p in inputs]
+    env = [os.getenv("VEDIC_CONFIG_YAML", ""), _dashboard_url()]
+    key = hashlib.sha1("\0".join(stamps + env).encode()).hexdigest()[:12]
+    return DIGEST_CACHE_DIR / f"digest-{dt.date.today()}-{key}.txt"
+
+
+def _cached_weekly_block() -> str:
+    """_weekly_block(), reused from disk on same-day reruns with unchanged inputs."""
+    path = _digest_cache_path()
+    if path.exists() and time.time() - path.stat().st_mtime < WEEKLY_CACHE_TTL:
+        return path.read_text()
+    digest = _weekly_block()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    for stale in path.parent.glob("digest-*.txt"):  # earlier days / inputs are never read again
+        stale.unlink(missing_ok=True)
+    path.write_text(digest)
+    return digest
+
+
 def _janam_patri_block() -> str:
     """Format janam patri recommendations in compact Slack style."""
-    root = Path(__file__).resolve().parent.parent
-    import sys
-    sys.path.insert(0, str(Path(__file__).resolve().parent))
-    from janam_patri import run_to_dict
-    jp = run_to_dict(root / "config.yaml")
+    jp = run_to_dict(ROOT / "config.yaml")
     if not jp:
         return ""
 
@@ -143,20 +179,19 @@ def send_digest(digest_text: str) -> dict:
     if not SLACK_WEBHOOK_URL:
         return {"status": "skipped", "reason": "SLACK_WEBHOOK_URL not set"}
 
-    digest_text = digest_text + "\n" + _janam_patri_block()
-    if SLACK_MEMBER_ID:
-        digest_text = f"<@{SLACK_MEMBER_ID}>\n{digest_text}"
-    elif SLACK_MENTION:
-        digest_text = f"{SLACK_MENTION}\n{digest_text}"
+    mention = f"<@{SLACK_MEMBER_ID}>" if SLACK_MEMBER_ID else SLACK_MENTION
+    parts = [mention] if mention else []
+    text = "\n".join([*parts, digest_text, _janam_patri_block()])
 
-    import httpx
-    resp = httpx.post(SLACK_WEBHOOK_URL, json={"text": digest_text}, timeout=30)
-    resp.raise_for_status()
+    resp = request_with_retry(_client(), "POST", SLACK_WEBHOOK_URL, json={"text": text})
     return {"status": "sent", "code": resp.status_code}
 
 
 if __name__ == "__main__":
-    digest = _weekly_block()
+    if os.environ.get("VERSE_SEARCH_WARMUP"):
+        from verse_search import warmup  # skills path is set up by the weekly_guidance import
+        warmup()
+    digest = _cached_weekly_block()
     print(digest + "\n" + _janam_patri_block())
     print("\n--- Sending to Slack ---")
     result = send_digest(digest)
@@ -7,14 +7,26 @@ from __future__ import annotations
 
 import os
 import json
+import atexit
 import datetime as dt
+from functools import lru_cache
 
 import httpx
 
+from http_retry import request_with_retry
+
 SUPERMEMORY_URL = "https://api.supermemory.com/v1/memories"
 API_KEY = os.getenv("SUPERMEMORY_API_KEY", "")
 
 
+@lru_cache(maxsize=1)
+def _client() -> httpx.Client:
+    """Shared authenticated client so sync + list reuse one connection."""
+    client = httpx.Client(timeout=30, headers={"Authorization": f"Bearer {API_KEY}"})
+    atexit.register(client.close)
+    return client
+
+
 def sync_digest(digest_text: str, metadata: dict | None = None) -> dict:
     """Push a weekly digest to Supermemory.
 
@@ -27,8 +39,7 @@ def sync_digest(digest_text: str, metadata: dict | None = None) -> dict:
         "content": digest_text,
         "metadata": metadata or {"source": "vedic-wisdom-weekly", "date": dt.date.today().isoformat()},
     }
-    resp = httpx.post(SUPERMEMORY_URL, json=payload, headers={"Authorization": f"Bearer {API_KEY}"}, timeout=30)
-    resp.raise_for_status()
+    resp = request_with_retry(_client(), "POST", SUPERMEMORY_URL, json=payload)
     return resp.json()
 
 
@@ -37,13 +48,7 @@ def list_memories(limit: int = 10) -> list[dict]:
     if not API_KEY:
         return []
 
-    resp = httpx.get(
-        SUPERMEMORY_URL,
-        params={"limit": limit},
-        headers={"Authorization": f"Bearer {API_KEY}"},
-        timeout=30,
-    )
-    resp.raise_for_status()
+    resp = request_with_retry(_client(), "GET", SUPERMEMORY_URL, params={"limit": limit})
     return resp.json().get("memories", [])
 
 
@@ -33,8 +33,9 @@ import swisseph as swe
 import yaml
 
 ROOT = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(ROOT / "scripts"))
-sys.path.insert(0, str(ROOT / "skills" / "sanskrit-wisdom" / "scripts"))
+for _dir in (str(ROOT / "scripts"), str(ROOT / "skills" / "sanskrit-wisdom" / "scripts")):
+    if _dir not in sys.path:
+        sys.path.insert(0, _dir)
 
 from panchang import (
     compute as panchang_compute, DailyPanchang,
@@ -7,26 +7,32 @@ outputs a weekly digest. Logs all runs to MLflow.
 from __future__ import annotations
 
 import datetime as dt
+import os
 import sys
 import time
-from dataclasses import dataclass, field
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 
-from panchang import compute, is_ekadashi, is_pradosham, is_amavasya, is_purnima, is_chaturthi, DailyPanchang
+from panchang import compute_range, is_ekadashi, is_pradosham, is_amavasya, is_purnima, is_chaturthi, DailyPanchang
 
 CONFIG_PATH = Path(__file__).resolve().parent.parent / "config.yaml"
+# Cosine score below which a semantic hit defers to a keyword match, if there is one.
+# Default -1 (the cosine minimum) keeps every semantic hit; tune per model/corpus via env.
+MIN_SEMANTIC_SCORE = float(os.environ.get("MIN_SEMANTIC_SCORE") or -1.0)
 
 _VERSE_SEARCH_DIR = Path(__file__).resolve().parent.parent / "skills" / "sanskrit-wisdom" / "scripts"
 _TRACKER_DIR = Path(__file__).resolve().parent.parent / "skills" / "ml-experiment"
-sys.path.insert(0, str(_VERSE_SEARCH_DIR))
-sys.path.insert(0, str(_TRACKER_DIR))
-from verse_search import semantic_search, search as keyword_search, Verse
-from tracker import log_notification
+for _dir in (str(_VERSE_SEARCH_DIR), str(_TRACKER_DIR)):
+    if _dir not in sys.path:  # repeat imports would otherwise stack duplicates
+        sys.path.insert(0, _dir)
+from verse_search import scored_search_batch, keyword_search, warmup, Verse
 
 
 # ── Data Models ──────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Observance:
     name: str
     date: dt.date
@@ -45,12 +51,28 @@ TITHI_QUERY_MAP = {
     "Dwadashi": "Vishnu devotion",
 }
 
+@dataclass(slots=True, frozen=True)
+class VerseView:
+    """Display fields of a matched verse; serialized to a dict only for JSON output."""
+    devanagari: str
+    transliteration: str
+    meaning: str
+    source: str
+    sampradaya: str | None = None
+    deity: str | None = None
+    script: str | None = None
+    category: str | None = None
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
 @dataclass
 class DailyVerse:
     date: dt.date
     tithi: str
     paksha: str
-    verse: dict | None
+    verse: VerseView | None
 
 
 @dataclass
@@ -59,7 +81,7 @@ class WeeklyDigest:
     week_end: dt.date
     panchang_days: list[DailyPanchang] = field(default_factory=list)
     observances: list[Observance] = field(default_factory=list)
-    verse: dict | None = None
+    verse: VerseView | None = None
     daily_verses: list[DailyVerse] = field(default_factory=list)
     lifestyle_recommendations: list[str] = field(default_factory=list)
 
@@ -82,9 +104,8 @@ def _detect_observances(p: DailyPanchang, day: dt.date) -> list[Observance]:
 
 def get_week_data(start: dt.date) -> tuple[list[DailyPanchang], list[Observance]]:
     """Compute panchangam and detect observances for a 7-day window."""
-    days = [compute(start + dt.timedelta(days=i)) for i in range(7)]
-    dates = [start + dt.timedelta(days=i) for i in range(7)]
-    observances = [obs for p, day in zip(days, dates) for obs in _detect_observances(p, day)]
+    days = compute_range(start, 7)
+    observances = [obs for p in days for obs in _detect_observances(p, p.date)]
     return days, observances
 
 
@@ -97,23 +118,45 @@ def _build_verse_query(observances: list[Observance], panchang_days: list[DailyP
     return " ".join(obs_terms + panchang_terms)
 
 
-def _verse_to_dict(v: Verse) -> dict:
-    """Convert a Verse dataclass to the digest-compatible dict format."""
-    return {
-        "devanagari": v.devanagari,
-        "transliteration": v.transliteration,
-        "meaning": v.meaning,
-        "source": v.source,
-        "sampradaya": v.sampradaya,
-        "deity": v.deity,
-        "script": v.script,
-        "category": v.category,
-    }
+def _verse_view(v: Verse) -> VerseView:
+    """Project a corpus Verse onto the fields the digest shows."""
+    return VerseView(
+        devanagari=v.devanagari,
+        transliteration=v.transliteration,
+        meaning=v.meaning,
+        source=v.source,
+        sampradaya=v.sampradaya,
+        deity=v.deity,
+        script=v.script,
+        category=v.category,
+    )
 
 
-def pair_verse(observances: list[Observance], panchang_days: list[DailyPanchang]) -> tuple[dict | None, dict]:
+def _search_many(queries: list[str]) -> list[list[Verse]]:
+    """Top verse per query from one batched semantic search, keyword fallback per weak miss.
+
+    Repeated queries (two Ekadashis, recurring tithi themes) are searched once.
+    """
+    unique = list(dict.fromkeys(queries))
+    batch = scored_search_batch(unique, top_k=1)
+    found = {q: _pick_hits(q, scored) for q, scored in zip(unique, batch)}
+    return [found[q] for q in queries]
+
+
+def _pick_hits(query: str, scored: list[tuple[Verse, float]]) -> list[Verse]:
+    """Confident semantic hits, else a keyword match, else whatever semantic search found."""
+    strong = [v for v, score in scored if score >= MIN_SEMANTIC_SCORE]
+    return strong or keyword_search(query, top_k=1) or [v for v, _ in scored]
+
+
+def pair_verse(
+    observances: list[Observance],
+    panchang_days: list[DailyPanchang],
+    hits: list[Verse] | None = None,
+) -> tuple[VerseView | None, dict]:
     """Pick a relevant Sanskrit verse via semantic search, with keyword fallback.
 
+    Pass hits from a batched search to skip the lookup.
     Returns (verse_dict, search_meta) where search_meta has query, latency_ms, verse_id.
     """
     meta: dict = {"query": "", "latency_ms": 0.0, "verse_id": "none", "verse_source": ""}
@@ -122,13 +165,13 @@ def pair_verse(observances: list[Observance], panchang_days: list[DailyPanchang]
     query = _build_verse_query(observances, panchang_days)
     meta["query"] = query
     t0 = time.perf_counter()
-    results = semantic_search(query, top_k=1) or keyword_search(query, top_k=1)
+    results = _search_many([query])[0] if hits is None else hits
     meta["latency_ms"] = round((time.perf_counter() - t0) * 1000, 1)
     if not results:
         return None, meta
     meta["verse_id"] = results[0].id
     meta["verse_source"] = results[0].source
-    return _verse_to_dict(results[0]), meta
+    return _verse_view(results[0]), meta
 
 
 def _query_for_tithi(p: DailyPanchang, observance_for_day: list[Observance]) -> str:
@@ -138,19 +181,33 @@ def _query_for_tithi(p: DailyPanchang, observance_for_day: list[Observance]) ->
     return TITHI_QUERY_MAP.get(p.tithi, f"{p.tithi} {p.nakshatra} dharma")
 
 
-def get_daily_verses(panchang_days: list[DailyPanchang], dates: list[dt.date], observances: list[Observance]) -> list[DailyVerse]:
+def _group_by_date(observances: list[Observance]) -> dict[dt.date, list[Observance]]:
+    """Observances keyed by the day they fall on."""
+    return {d: [o for o in observances if o.date == d] for d in dict.fromkeys(o.date for o in observances)}
+
+
+def _daily_queries(
+    panchang_days: list[DailyPanchang],
+    dates: list[dt.date],
+    obs_by_date: dict[dt.date, list[Observance]],
+) -> list[str]:
+    """One search query per day, keyed on that day's tithi and observances."""
+    return [_query_for_tithi(p, obs_by_date.get(day, [])) for p, day in zip(panchang_days, dates)]
+
+
+def get_daily_verses(
+    panchang_days: list[DailyPanchang],
+    dates: list[dt.date],
+    observances: list[Observance],
+    hits: list[list[Verse]] | None = None,
+) -> list[DailyVerse]:
     """One shloka per day by tithi (and observance) for the week — EST dates."""
-    obs_by_date: dict[dt.date, list[Observance]] = {}
-    for o in observances:
-        obs_by_date.setdefault(o.date, []).append(o)
-    out = []
-    for p, day in zip(panchang_days, dates):
-        obs = obs_by_date.get(day, [])
-        query = _query_for_tithi(p, obs)
-        results = semantic_search(query, top_k=1) or keyword_search(query, top_k=1)
-        verse = _verse_to_dict(results[0]) if results else None
-        out.append(DailyVerse(date=p.date, tithi=p.tithi, paksha=p.paksha, verse=verse))
-    return out
+    if hits is None:
+        hits = _search_many(_daily_queries(panchang_days, dates, _group_by_date(observances)))
+    return [
+        DailyVerse(date=p.date, tithi=p.tithi, paksha=p.paksha, verse=_verse_view(r[0]) if r else None)
+        for p, r in zip(panchang_days, hits)
+    ]
 
 
 def build_lifestyle_recommendations(
@@ -179,59 +236,65 @@ def build_lifestyle_recommendations(
 
 # ── Output ───────────────────────────────────────────────────────────
 
-def format_digest(digest: WeeklyDigest) -> str:
-    """Pretty-print the weekly digest."""
-    lines = [
-        "═══ Vedic Wisdom Weekly ═══",
-        f"Week: {digest.week_start} → {digest.week_end}",
-        "",
-        "📅 Daily Panchangam:",
-    ] + [f"  {p.date} ({p.vaara}) | {p.paksha} {p.tithi} | {p.nakshatra} | Sunrise {p.sunrise}" for p in digest.panchang_days]
-
-    lines.append("")
+def _daily_verse_lines(daily_verses: list[DailyVerse]) -> Iterator[str]:
+    """Shloka-by-tithi section, one block per day."""
+    yield ""
+    yield "📿 Shloka by Tithi (this week, EST):"
+    for dv in daily_verses:
+        tithi_line = f"  {dv.date} ({dv.paksha} {dv.tithi})"
+        if not dv.verse:
+            yield f"{tithi_line} — (no verse matched)"
+            continue
+        yield tithi_line
+        yield f"    {dv.verse.devanagari}"
+        yield f"    {dv.verse.transliteration}"
+        yield f"    — {dv.verse.meaning} [{dv.verse.source}]"
+
+
+def _digest_lines(digest: WeeklyDigest) -> Iterator[str]:
+    """Every line of the text digest, in order."""
+    yield "═══ Vedic Wisdom Weekly ═══"
+    yield f"Week: {digest.week_start} → {digest.week_end}"
+    yield ""
+    yield "📅 Daily Panchangam:"
+    yield from (f"  {p.date} ({p.vaara}) | {p.paksha} {p.tithi} | {p.nakshatra} | Sunrise {p.sunrise}" for p in digest.panchang_days)
+    yield ""
     if digest.observances:
-        lines.append("🔔 Observances This Week:")
-        lines += [f"  • {o.date} — {o.name} ({o.deity}): {o.description}" for o in digest.observances]
+        yield "🔔 Observances This Week:"
+        yield from (f"  • {o.date} — {o.name} ({o.deity}): {o.description}" for o in digest.observances)
     else:
-        lines.append("No major observances this week.")
-
+        yield "No major observances this week."
     if digest.daily_verses:
-        lines.append("")
-        lines.append("📿 Shloka by Tithi (this week, EST):")
-        for dv in digest.daily_verses:
-            tithi_line = f"  {dv.date} ({dv.paksha} {dv.tithi})"
-            if dv.verse:
-                lines.append(tithi_line)
-                lines.append(f"    {dv.verse['devanagari']}")
-                lines.append(f"    {dv.verse['transliteration']}")
-                lines.append(f"    — {dv.verse['meaning']} [{dv.verse.get('source', '')}]")
-            else:
-                lines.append(f"{tithi_line} — (no verse matched)")
-
+        yield from _daily_verse_lines(digest.daily_verses)
     if digest.verse:
-        lines += [
-            "",
-            "🙏 Verse of the Week:",
-            f"  {digest.verse['devanagari']}",
-            f"  {digest.verse['transliteration']}",
-            f"  — {digest.verse['meaning']}",
-            f"  [{digest.verse.get('source', '')}]",
-        ]
-
+        v = digest.verse
+        yield from ("", "🙏 Verse of the Week:", f"  {v.devanagari}", f"  {v.transliteration}", f"  — {v.meaning}", f"  [{v.source}]")
     if digest.lifestyle_recommendations:
-        lines += ["", "🌿 Lifestyle recommendations:"]
-        lines += [f"  • {r}" for r in digest.lifestyle_recommendations]
-    return "\n".join(lines)
+        yield from ("", "🌿 Lifestyle recommendations:")
+        yield from (f"  • {r}" for r in digest.lifestyle_recommendations)
+
+
+def format_digest(digest: WeeklyDigest) -> str:
+    """Pretty-print the weekly digest."""
+    return "\n".join(_digest_lines(digest))
 
 
 def build_digest(start: dt.date | None = None) -> tuple[WeeklyDigest, dict]:
     """Build the weekly digest (no MLflow log). Returns (digest, search_meta)."""
     start = start or dt.date.today()
-    end = start + dt.timedelta(days=6)
-    dates = [start + dt.timedelta(days=i) for i in range(7)]
     days, observances = get_week_data(start)
-    verse, meta = pair_verse(observances, days)
-    daily_verses = get_daily_verses(days, dates, observances)
+    dates, obs_by_date = [p.date for p in days], _group_by_date(observances)
+    end = dates[-1]
+    # Verse of the week + one verse per day, embedded and searched as a single batch
+    week_query = [_build_verse_query(observances, days)] if observances else []
+    queries = week_query + _daily_queries(days, dates, obs_by_date)
+    t0 = time.perf_counter()
+    hits = _search_many(queries)
+    # Per-query share of the batch, so search_latency_ms stays comparable with single-search runs
+    latency_ms = round((time.perf_counter() - t0) * 1000 / len(queries), 1)
+    verse, meta = pair_verse(observances, days, hits[0] if observances else None)
+    meta["latency_ms"] = latency_ms if observances else 0.0
+    daily_verses = get_daily_verses(days, dates, observances, hits[len(week_query):])
     lifestyle_recs = build_lifestyle_recommendations(days, observances)
     digest = WeeklyDigest(
         week_start=start, week_end=end, panchang_days=days, observances=observances,
@@ -243,27 +306,32 @@ def build_digest(start: dt.date | None = None) -> tuple[WeeklyDigest, dict]:
 def digest_to_dict(digest: WeeklyDigest) -> dict:
     """Serialize digest to JSON-serializable dict for dashboard."""
     def day_dict(p: DailyPanchang) -> dict:
-        return {"date": str(p.date), "vaara": p.vaara, "tithi": p.tithi, "paksha": p.paksha, "nakshatra": p.nakshatra, "sunrise": p.sunrise}
+        return {"date": p.date.isoformat(), "vaara": p.vaara, "tithi": p.tithi, "paksha": p.paksha, "nakshatra": p.nakshatra, "sunrise": p.sunrise}
 
-    obs_list = [{"date": str(o.date), "name": o.name, "deity": o.deity, "description": o.description} for o in digest.observances]
-    daily = [{"date": str(dv.date), "tithi": dv.tithi, "paksha": dv.paksha, "verse": dv.verse} for dv in digest.daily_verses]
+    obs_list = [{"date": o.date.isoformat(), "name": o.name, "deity": o.deity, "description": o.description} for o in digest.observances]
+    daily = [{"date": dv.date.isoformat(), "tithi": dv.tithi, "paksha": dv.paksha, "verse": dv.verse.as_dict() if dv.verse else None} for dv in digest.daily_verses]
     return {
-        "week_start": str(digest.week_start),
-        "week_end": str(digest.week_end),
+        "week_start": digest.week_start.isoformat(),
+        "week_end": digest.week_end.isoformat(),
         "panchang_days": [day_dict(p) for p in digest.panchang_days],
         "observances": obs_list,
         "daily_verses": daily,
-        "verse_of_week": digest.verse,
+        "verse_of_week": digest.verse.as_dict() if digest.verse else None,
         "lifestyle_recommendations": digest.lifestyle_recommendations,
     }
 
 
 def generate_weekly(start: dt.date | None = None) -> str:
     """Entry point — generate this week's notification and log to MLflow."""
-    digest, meta = build_digest(start)
+    from tracker import log_notification, prepare_tracking  # MLflow loads only when a run is logged
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        # The MLflow experiment lookup is a tracking-store round trip; overlap it with the week build
+        pool.submit(prepare_tracking)
+        digest, meta = build_digest(start)
     digest_text = format_digest(digest)
     log_notification(
-        week=str(digest.week_start),
+        week=digest.week_start.isoformat(),
         observance_count=len(digest.observances),
         verse_id=meta.get("verse_id", "none"),
         observance_names=", ".join(o.name for o in digest.observances),
@@ -276,4 +344,6 @@ def generate_weekly(start: dt.date | None = None) -> str:
 
 
 if __name__ == "__main__":
+    if os.environ.get("VERSE_SEARCH_WARMUP"):
+        warmup()
     print(generate_weekly())
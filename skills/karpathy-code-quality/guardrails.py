@@ -9,10 +9,18 @@ Static checks and helpers to enforce clean, minimal Python:
 from __future__ import annotations
 
 import ast
+import hashlib
+import json
 import sys
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
 from pathlib import Path
 
+# Below this many files, worker start-up costs more than parsing serially
+PARALLEL_MIN_FILES = 32
+# Violations per linted tree, keyed by path and (mtime, size); one file per target directory
+CACHE_DIR = Path.home() / ".cache" / "vedic-wisdom" / "guardrails"
+
 
 @dataclass
 class Violation:
@@ -22,49 +30,75 @@ class Violation:
     message: str
 
 
+def _is_append_call(stmt: ast.stmt) -> bool:
+    """True for a bare `x.append(...)` expression statement."""
+    return (
+        isinstance(stmt, ast.Expr)
+        and isinstance(stmt.value, ast.Call)
+        and isinstance(stmt.value.func, ast.Attribute)
+        and stmt.value.func.attr == "append"
+    )
+
+
+class _GuardrailVisitor(ast.NodeVisitor):
+    """One traversal that collects every guardrail violation, bucketed by rule."""
+
+    def __init__(self, filepath: str, max_lines: int = 30):
+        self.filepath, self.max_lines, self._try_depth = filepath, max_lines, 0
+        self.nested_try: list[Violation] = []
+        self.too_long: list[Violation] = []
+        self.verbose_loops: list[Violation] = []
+
+    @property
+    def violations(self) -> list[Violation]:
+        return self.nested_try + self.too_long + self.verbose_loops
+
+    def visit_Try(self, node: ast.Try) -> None:
+        # One violation per enclosing try, as a walk from each outer try would report
+        self.nested_try += [
+            Violation(self.filepath, node.lineno, "NO_NESTED_TRY", "Nested try/except detected")
+            for _ in range(self._try_depth)
+        ]
+        self._try_depth += 1
+        self.generic_visit(node)
+        self._try_depth -= 1
+
+    def visit_FunctionDef(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        length = (node.end_lineno or node.lineno) - node.lineno + 1
+        if length > self.max_lines:
+            msg = f"{node.name}() is {length} lines (max {self.max_lines})"
+            self.too_long.append(Violation(self.filepath, node.lineno, "FUNC_TOO_LONG", msg))
+        self.generic_visit(node)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_For(self, node: ast.For) -> None:
+        self.verbose_loops += [
+            Violation(self.filepath, node.lineno, "USE_COMPREHENSION", "Loop+append pattern — use a list comprehension")
+            for stmt in node.body if _is_append_call(stmt)
+        ]
+        self.generic_visit(node)
+
+
+def _visit(tree: ast.AST, filepath: str, max_lines: int = 30) -> _GuardrailVisitor:
+    visitor = _GuardrailVisitor(filepath, max_lines)
+    visitor.visit(tree)
+    return visitor
+
+
 def check_nested_try(tree: ast.AST, filepath: str) -> list[Violation]:
     """Flag nested try/except blocks."""
-    violations = []
-    for node in ast.walk(tree):
-        if not isinstance(node, ast.Try):
-            continue
-        for child in ast.walk(node):
-            if child is not node and isinstance(child, ast.Try):
-                violations.append(Violation(filepath, child.lineno, "NO_NESTED_TRY", "Nested try/except detected"))
-    return violations
+    return _visit(tree, filepath).nested_try
 
 
 def check_function_length(tree: ast.AST, filepath: str, max_lines: int = 30) -> list[Violation]:
     """Flag functions longer than max_lines."""
-    violations = []
-    for node in ast.walk(tree):
-        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            continue
-        length = (node.end_lineno or node.lineno) - node.lineno + 1
-        if length > max_lines:
-            violations.append(
-                Violation(filepath, node.lineno, "FUNC_TOO_LONG", f"{node.name}() is {length} lines (max {max_lines})")
-            )
-    return violations
+    return _visit(tree, filepath, max_lines).too_long
 
 
 def check_verbose_loop(tree: ast.AST, filepath: str) -> list[Violation]:
     """Flag for-loops that append to a list (should be a comprehension)."""
-    violations = []
-    for node in ast.walk(tree):
-        if not isinstance(node, ast.For):
-            continue
-        for stmt in node.body:
-            if (
-                isinstance(stmt, ast.Expr)
-                and isinstance(stmt.value, ast.Call)
-                and isinstance(stmt.value.func, ast.Attribute)
-                and stmt.value.func.attr == "append"
-            ):
-                violations.append(
-                    Violation(filepath, node.lineno, "USE_COMPREHENSION", "Loop+append pattern — use a list comprehension")
-                )
-    return violations
+    return _visit(tree, filepath).verbose_loops
 
 
 def lint_file(filepath: str | Path) -> list[Violation]:
@@ -74,18 +108,59 @@ def lint_file(filepath: str | Path) -> list[Violation]:
         tree = ast.parse(source, filename=str(filepath))
     except (UnicodeDecodeError, SyntaxError):
         return []
-    fp = str(filepath)
-    return check_nested_try(tree, fp) + check_function_length(tree, fp) + check_verbose_loop(tree, fp)
+    return _visit(tree, str(filepath)).violations
+
+
+def _stamp(path: Path) -> list[int]:
+    st = path.stat()
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _load_cache(cache_path: Path) -> dict:
+    """Cached file entries, or {} if missing, corrupt or written by an older guardrails.py."""
+    try:
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return cache.get("files", {}) if cache.get("rules") == _stamp(Path(__file__)) else {}
+
+
+def _cache_path(directory: str | Path) -> Path:
+    key = hashlib.sha1(str(Path(directory).resolve()).encode()).hexdigest()
+    return CACHE_DIR / f"{key}.json"
+
+
+def _save_cache(cache_path: Path, files: dict) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps({"rules": _stamp(Path(__file__)), "files": files}), encoding="utf-8")
+    except OSError:
+        pass  # unwritable cache dir: lint still works, just not incrementally
+
+
+def _lint_many(py_files: list[Path]) -> list[list[Violation]]:
+    if len(py_files) < PARALLEL_MIN_FILES:
+        return [lint_file(p) for p in py_files]
+    with ProcessPoolExecutor() as pool:
+        return list(pool.map(lint_file, py_files, chunksize=16))
 
 
 def lint_directory(directory: str | Path) -> list[Violation]:
-    """Lint all .py files in a directory tree."""
-    violations = []
+    """Lint all .py files in a directory tree, re-linting only files changed since the last run."""
     skip = {".venv", "venv", "node_modules", ".git", "__pycache__"}
-    for py_file in Path(directory).rglob("*.py"):
-        if not (skip & set(py_file.parts)):
-            violations.extend(lint_file(py_file))
-    return violations
+    py_files = [p for p in Path(directory).rglob("*.py") if not (skip & set(p.parts))]
+    cache_path = _cache_path(directory)
+    cached = _load_cache(cache_path)
+    stamps = {str(p): _stamp(p) for p in py_files}
+    files = {k: cached[k] for k, stamp in stamps.items() if cached.get(k, {}).get("stamp") == stamp}
+    stale = [p for p in py_files if str(p) not in files]
+    files.update({
+        str(p): {"stamp": stamps[str(p)], "violations": [asdict(v) for v in found]}
+        for p, found in zip(stale, _lint_many(stale))
+    })
+    if stale or len(files) != len(cached):
+        _save_cache(cache_path, files)
+    return [Violation(**v) for p in py_files for v in files[str(p)]["violations"]]
 
 
 if __name__ == "__main__":
@@ -7,8 +7,10 @@ from __future__ import annotations
 
 import os
 import sys
+import threading
 from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import cache
 import tempfile
 
 import mlflow
@@ -16,26 +18,33 @@ import mlflow
 TRACKING_URI = os.getenv("MLFLOW_TRACKING_URI", "sqlite:///mlflow.db")
 EXPERIMENT_NAME = "vedic-wisdom-weekly"
 
-# Track whether MLflow is available (set on first connection attempt)
-_mlflow_available: bool | None = None
+# Serializes the first lookup so concurrent callers resolve the experiment only once
+_experiment_lock = threading.Lock()
 
 
 def _ensure_experiment() -> str | None:
     """Create or get the MLflow experiment, return experiment ID or None if unavailable."""
-    global _mlflow_available
-    if _mlflow_available is False:
-        return None
+    with _experiment_lock:
+        return _resolve_experiment()
+
+
+@cache
+def _resolve_experiment() -> str | None:
+    """Set the tracking URI and resolve the experiment once per process (success or failure)."""
     try:
         mlflow.set_tracking_uri(TRACKING_URI)
         exp = mlflow.get_experiment_by_name(EXPERIMENT_NAME)
-        _mlflow_available = True
         return exp.experiment_id if exp else mlflow.create_experiment(EXPERIMENT_NAME)
     except Exception as e:
-        _mlflow_available = False
         print(f"[tracker] MLflow unavailable ({type(e).__name__}), skipping tracking", file=sys.stderr)
         return None
 
 
+def prepare_tracking() -> bool:
+    """Resolve the experiment ahead of the first log call; True if MLflow is reachable."""
+    return _ensure_experiment() is not None
+
+
 @dataclass
 class SearchMetrics:
     query: str
@@ -48,11 +57,11 @@ class SearchMetrics:
 def track_search(query: str):
     """Context manager to track a verse search run in MLflow."""
     metrics = SearchMetrics(query=query, results_count=0, top_score=0.0, latency_ms=0.0)
-    if _ensure_experiment() is None:
+    experiment_id = _ensure_experiment()
+    if experiment_id is None:
         yield metrics
         return
-    mlflow.set_experiment(EXPERIMENT_NAME)
-    with mlflow.start_run(run_name=f"search-{query[:30]}"):
+    with mlflow.start_run(experiment_id=experiment_id, run_name=f"search-{query[:30]}"):
         yield metrics
         mlflow.log_param("query", query)
         mlflow.log_metrics({
@@ -75,10 +84,10 @@ def log_notification(
     digest_text: str = "",
 ) -> None:
     """Log a weekly notification generation event with full context."""
-    if _ensure_experiment() is None:
+    experiment_id = _ensure_experiment()
+    if experiment_id is None:
         return
-    mlflow.set_experiment(EXPERIMENT_NAME)
-    with mlflow.start_run(run_name=f"notify-{week}"):
+    with mlflow.start_run(experiment_id=experiment_id, run_name=f"notify-{week}"):
         mlflow.log_params({
             "week": week,
             "verse_id": verse_id or "none",
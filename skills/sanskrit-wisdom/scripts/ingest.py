@@ -6,11 +6,15 @@ and stores in on-disk Qdrant collection.
 """
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+import os
 import sys
-import time
+import tarfile
+import tempfile
 from dataclasses import asdict
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 
 import httpx
 
@@ -20,13 +24,29 @@ GITA_DIR = DATA_DIR / "gita"
 STOTRAS_PATH = DATA_DIR / "verses.json"
 QDRANT_PATH = DATA_DIR / "qdrant_store"
 GITA_NORMALIZED_PATH = DATA_DIR / "gita_normalized.json"
+CORPUS_EMBED_CACHE_PATH = DATA_DIR / "corpus_embeddings.npz"
 
 # Source
 GITHUB_API = "https://api.github.com/repos/vedicscriptures/bhagavad-gita/contents/slok"
 GITHUB_RAW = "https://raw.githubusercontent.com/vedicscriptures/bhagavad-gita/main/slok"
+GITHUB_TARBALL = "https://github.com/vedicscriptures/bhagavad-gita/archive/refs/heads/main.tar.gz"
+
+# Cap on in-flight raw.githubusercontent.com requests during a cold fetch
+FETCH_CONCURRENCY = 16
+
+# Bulk upload: batches pipelined across workers, HNSW indexing deferred until the load finishes
+UPLOAD_BATCH_SIZE = 32
+UPLOAD_PARALLEL = 4
+INDEXING_THRESHOLD = 20000
 
 COLLECTION = "vedic_verses"
 EMBED_MODEL = "paraphrase-multilingual-MiniLM-L12-v2"
+# "onnx" embeds the corpus with an int8-quantized ONNX export (needs sentence-transformers[onnx]>=3.2)
+EMBED_BACKEND = os.environ.get("EMBED_BACKEND", "torch")
+ONNX_MODEL_DIR = DATA_DIR / "onnx_model"
+ONNX_QUANTIZED_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+# Torch device override ("cuda", "cpu", ...); unset lets sentence-transformers pick CUDA when present
+EMBED_DEVICE = os.environ.get("EMBED_DEVICE") or None
 
 # ── Gita chapter themes for tagging ──────────────────────────────────
 
@@ -51,6 +71,12 @@ CHAPTER_THEMES: dict[int, list[str]] = {
     18: ["moksha", "liberation", "renunciation", "duty", "karma", "surrender"],
 }
 
+# Deduped per-chapter tags in a stable order, so embedding text is identical across runs
+_CHAPTER_TAGS: dict[int, list[str]] = {
+    ch: list(dict.fromkeys(themes + ["vishnu", "gita"])) for ch, themes in CHAPTER_THEMES.items()
+}
+_FALLBACK_TAGS = ["gita", "vishnu"]
+
 
 # ── Fetch ────────────────────────────────────────────────────────────
 
@@ -61,29 +87,55 @@ def fetch_verse_list() -> list[str]:
     return sorted(item["name"] for item in resp.json())
 
 
-def fetch_verse(filename: str) -> dict:
-    """Download a single verse JSON from GitHub."""
-    resp = httpx.get(f"{GITHUB_RAW}/{filename}", timeout=30)
-    resp.raise_for_status()
-    return resp.json()
-
-
-def _fetch_or_cache(fname: str, batch_pause: float) -> dict:
+async def _afetch_or_cache(client: httpx.AsyncClient, sem: asyncio.Semaphore, fname: str) -> dict:
     """Fetch a single verse from GitHub or read from local cache."""
     cache_path = GITA_DIR / fname
     if cache_path.exists():
         return json.loads(cache_path.read_text())
-    raw = fetch_verse(fname)
+    async with sem:
+        resp = await client.get(f"{GITHUB_RAW}/{fname}")
+    resp.raise_for_status()
+    raw = resp.json()
     cache_path.write_text(json.dumps(raw, ensure_ascii=False, indent=2))
-    time.sleep(batch_pause)
     return raw
 
 
-def fetch_all_gita(batch_pause: float = 0.05) -> list[dict]:
-    """Fetch all Gita verses. Saves raw JSONs to gita/ dir."""
+async def _afetch_all(filenames: list[str]) -> list[dict]:
+    """Fetch verses concurrently, at most FETCH_CONCURRENCY requests at a time; keeps input order."""
+    sem = asyncio.Semaphore(FETCH_CONCURRENCY)
+    async with httpx.AsyncClient(timeout=30) as client:
+        return await asyncio.gather(*(_afetch_or_cache(client, sem, f) for f in filenames))
+
+
+def _is_slok_member(member: tarfile.TarInfo) -> bool:
+    path = PurePosixPath(member.name)
+    return member.isfile() and path.parent.name == "slok" and path.suffix == ".json"
+
+
+def fetch_all_gita_tarball() -> list[str]:
+    """Download the repo archive once and unpack slok/*.json into gita/. Returns the filenames written."""
+    with tempfile.TemporaryFile() as buf:
+        with httpx.stream("GET", GITHUB_TARBALL, timeout=60, follow_redirects=True) as resp:
+            resp.raise_for_status()
+            for chunk in resp.iter_bytes():
+                buf.write(chunk)
+        buf.seek(0)
+        with tarfile.open(fileobj=buf, mode="r:gz") as tar:
+            members = [m for m in tar.getmembers() if _is_slok_member(m)]
+            for m in members:
+                (GITA_DIR / PurePosixPath(m.name).name).write_bytes(tar.extractfile(m).read())
+    return [PurePosixPath(m.name).name for m in members]
+
+
+def fetch_all_gita() -> list[dict]:
+    """Fetch all Gita verses. Saves raw JSONs to gita/ dir.
+
+    A cold cache is filled from one archive download; a warm one is topped up per file.
+    """
     GITA_DIR.mkdir(parents=True, exist_ok=True)
-    filenames = fetch_verse_list()
-    verses = [_fetch_or_cache(f, batch_pause) for f in filenames]
+    cold = not any(GITA_DIR.glob("*.json"))
+    filenames = sorted(fetch_all_gita_tarball()) if cold else fetch_verse_list()
+    verses = asyncio.run(_afetch_all(filenames))
     print(f"  Total: {len(verses)} Gita verses")
     return verses
 
@@ -107,14 +159,13 @@ def normalize_gita(raw: dict) -> dict:
     ch = raw.get("chapter", 0)
     verse = raw.get("verse", 0)
     meaning = _best_english(raw)
-    tags = CHAPTER_THEMES.get(ch, ["gita"]) + ["vishnu", "gita"]
     return {
         "id": f"bg-{ch}.{verse}",
         "devanagari": raw.get("slok", ""),
         "transliteration": raw.get("transliteration", ""),
         "meaning": meaning,
         "source": f"Bhagavad Gita {ch}.{verse}",
-        "tags": list(set(tags)),
+        "tags": _CHAPTER_TAGS.get(ch, _FALLBACK_TAGS),
     }
 
 
@@ -129,25 +180,75 @@ def normalize_all(gita_raw: list[dict]) -> list[dict]:
     """Normalize Gita + stotras into a unified corpus."""
     gita = [normalize_gita(r) for r in gita_raw]
     stotras = load_stotras()
-    # Dedupe by id
-    seen = {v["id"] for v in gita}
-    stotras = [s for s in stotras if s["id"] not in seen]
-    corpus = gita + stotras
-    print(f"  Corpus: {len(gita)} Gita + {len(stotras)} stotras = {len(corpus)} total")
+    # Dedupe by id in one dict pass; Gita entries win over stotras with the same id
+    merged = {v["id"]: v for v in gita}
+    n_gita = len(merged)
+    for s in stotras:
+        merged.setdefault(s["id"], s)
+    corpus = list(merged.values())
+    print(f"  Corpus: {n_gita} Gita + {len(corpus) - n_gita} stotras = {len(corpus)} total")
     return corpus
 
 
 # ── Embed & Upsert ──────────────────────────────────────────────────
 
-def _embed_corpus(corpus: list[dict]) -> tuple:
-    """Load model and embed all verses. Returns (embeddings, dim)."""
+def _load_onnx_model() -> "SentenceTransformer":
+    """Int8 dynamically quantized ONNX export of EMBED_MODEL; exported once, then reused from data/."""
+    from sentence_transformers import SentenceTransformer, export_dynamic_quantized_onnx_model
+
+    if not (ONNX_MODEL_DIR / ONNX_QUANTIZED_FILE).exists():
+        model = SentenceTransformer(EMBED_MODEL, backend="onnx")
+        model.save(str(ONNX_MODEL_DIR))
+        export_dynamic_quantized_onnx_model(model, "avx512_vnni", str(ONNX_MODEL_DIR))
+    return SentenceTransformer(str(ONNX_MODEL_DIR), backend="onnx", model_kwargs={"file_name": ONNX_QUANTIZED_FILE})
+
+
+def _load_torch_model() -> tuple["SentenceTransformer", bool]:
+    """EMBED_MODEL on EMBED_DEVICE, cast to FP16 on a GPU. Returns (model, on_cuda)."""
     from sentence_transformers import SentenceTransformer
 
-    print(f"  Loading embedding model: {EMBED_MODEL}")
-    model = SentenceTransformer(EMBED_MODEL)
-    texts = [f"{v['meaning']} {' '.join(v['tags'])}" for v in corpus]
+    model = SentenceTransformer(EMBED_MODEL, device=EMBED_DEVICE)
+    on_cuda = model.device.type == "cuda"
+    return (model.half() if on_cuda else model), on_cuda
+
+
+def _embed_texts(corpus: list[dict]) -> list[str]:
+    return [f"{v['meaning']} {' '.join(v['tags'])}" for v in corpus]
+
+
+def _embed_corpus(corpus: list[dict]) -> tuple:
+    """Load model and embed all verses. Returns (embeddings, dim)."""
+    print(f"  Loading embedding model: {EMBED_MODEL} ({EMBED_BACKEND})")
+    model, on_cuda = (_load_onnx_model(), False) if EMBED_BACKEND == "onnx" else _load_torch_model()
+    texts = _embed_texts(corpus)
     print(f"  Embedding {len(texts)} verses ({model.get_sentence_embedding_dimension()}d)...")
-    return model.encode(texts, show_progress_bar=True, batch_size=64), model.get_sentence_embedding_dimension()
+    # One contiguous (N, dim) float32 array, unit-length so Qdrant's cosine normalisation is a no-op
+    embeddings = model.encode(
+        texts, show_progress_bar=True, batch_size=128 if on_cuda else 64,
+        convert_to_numpy=True, normalize_embeddings=True,
+    )
+    return embeddings.astype("float32", copy=False), model.get_sentence_embedding_dimension()
+
+
+def _corpus_key(corpus: list[dict]) -> str:
+    """Hash of the embedded text plus the model settings that shape its vectors."""
+    blob = json.dumps([EMBED_MODEL, EMBED_BACKEND, _embed_texts(corpus)], ensure_ascii=False)
+    return hashlib.blake2b(blob.encode(), digest_size=16).hexdigest()
+
+
+def _cached_embeddings(corpus: list[dict]) -> tuple:
+    """Reuse the last run's embeddings when the corpus text is unchanged; else embed and save them."""
+    import numpy as np
+
+    key = _corpus_key(corpus)
+    if CORPUS_EMBED_CACHE_PATH.exists():
+        with np.load(CORPUS_EMBED_CACHE_PATH) as cached:
+            if str(cached["key"]) == key:
+                print("  Corpus text unchanged; reusing cached embeddings")
+                return cached["emb"], int(cached["dim"])
+    embeddings, dim = _embed_corpus(corpus)
+    np.savez_compressed(CORPUS_EMBED_CACHE_PATH, emb=embeddings, dim=dim, key=key)
+    return embeddings, dim
 
 
 def _upsert_to_qdrant(corpus: list[dict], embeddings, dim: int) -> int:
@@ -158,16 +259,27 @@ def _upsert_to_qdrant(corpus: list[dict], embeddings, dim: int) -> int:
     client = QdrantClient(path=str(QDRANT_PATH))
     if client.collection_exists(COLLECTION):
         client.delete_collection(COLLECTION)
-    client.create_collection(COLLECTION, vectors_config=models.VectorParams(size=dim, distance=models.Distance.COSINE))
-    points = [models.PointStruct(id=i, vector=embeddings[i].tolist(), payload=corpus[i]) for i in range(len(corpus))]
-    client.upsert(COLLECTION, points=points, wait=True)
-    print(f"  Upserted {len(points)} vectors to Qdrant at {QDRANT_PATH}")
-    return len(points)
+    client.create_collection(
+        COLLECTION,
+        # FP32 originals stay memory-mapped on disk; the int8 copies below drive search from RAM
+        vectors_config=models.VectorParams(size=dim, distance=models.Distance.COSINE, on_disk=True),
+        optimizers_config=models.OptimizersConfigDiff(indexing_threshold=0),
+        quantization_config=models.ScalarQuantization(
+            scalar=models.ScalarQuantizationConfig(type=models.ScalarType.INT8, quantile=0.99, always_ram=True),
+        ),
+    )
+    client.upload_collection(
+        collection_name=COLLECTION, vectors=embeddings, payload=corpus, ids=list(range(len(corpus))),
+        batch_size=UPLOAD_BATCH_SIZE, parallel=UPLOAD_PARALLEL, wait=True,
+    )
+    client.update_collection(COLLECTION, optimizers_config=models.OptimizersConfigDiff(indexing_threshold=INDEXING_THRESHOLD))
+    print(f"  Upserted {len(corpus)} vectors to Qdrant at {QDRANT_PATH}")
+    return len(corpus)
 
 
 def embed_and_upsert(corpus: list[dict]) -> int:
     """Embed verse text and upsert into on-disk Qdrant collection."""
-    embeddings, dim = _embed_corpus(corpus)
+    embeddings, dim = _cached_embeddings(corpus)
     return _upsert_to_qdrant(corpus, embeddings, dim)
 
 
@@ -181,8 +293,9 @@ def main():
     print("2. Normalizing corpus...")
     corpus = normalize_all(gita_raw)
 
-    # Save normalized for inspection
-    GITA_NORMALIZED_PATH.write_text(json.dumps(corpus, ensure_ascii=False, indent=2))
+    # Save normalized for inspection; json.dump writes chunk by chunk instead of building one big str
+    with GITA_NORMALIZED_PATH.open("w", encoding="utf-8") as f:
+        json.dump(corpus, f, ensure_ascii=False, indent=2)
     print(f"   Saved normalized corpus to {GITA_NORMALIZED_PATH}")
 
     print("3. Embedding & upserting to Qdrant...")
@@ -5,10 +5,16 @@ or keyword fallback. Returns verses in Devanagari + transliteration + meaning fo
 """
 from __future__ import annotations
 
+import hashlib
+import heapq
 import json
+import os
 import sys
+from collections import Counter
 from dataclasses import dataclass
 from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 
 DATA_DIR = Path(__file__).resolve().parent.parent / "data"
@@ -16,9 +22,10 @@ VERSES_PATH = DATA_DIR / "verses.json"
 QDRANT_PATH = DATA_DIR / "qdrant_store"
 COLLECTION_NAME = "vedic_verses"
 EMBED_MODEL = "paraphrase-multilingual-MiniLM-L12-v2"
+EMBED_CACHE_PATH = Path.home() / ".cache" / "vedic-wisdom" / "query_embeddings.json"
 
 
-@dataclass
+@dataclass(slots=True)
 class Verse:
     id: str
     devanagari: str
@@ -47,6 +54,12 @@ def _get_qdrant_client() -> "QdrantClient | None":
     """Connect to on-disk Qdrant store; returns None if path missing."""
     if not QDRANT_PATH.exists():
         return None
+    return _open_qdrant()
+
+
+@lru_cache(maxsize=1)
+def _open_qdrant() -> "QdrantClient":
+    """One client per process: the local store is mmapped once and its folder lock taken once."""
     from qdrant_client import QdrantClient
     return QdrantClient(path=str(QDRANT_PATH))
 
@@ -55,31 +68,91 @@ def _get_qdrant_client() -> "QdrantClient | None":
 def _get_embedder() -> "SentenceTransformer":
     """Lazy-load the multilingual sentence transformer (cached at module level)."""
     from sentence_transformers import SentenceTransformer
-    return SentenceTransformer(EMBED_MODEL)
+    return SentenceTransformer(EMBED_MODEL, device=os.environ.get("EMBED_DEVICE") or None)
+
+
+@lru_cache(maxsize=1)
+def _embedding_cache() -> dict[str, list[float]]:
+    """Query embeddings persisted across runs, keyed by _cache_key; {} if missing or corrupt."""
+    try:
+        return json.loads(EMBED_CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_embedding_cache(cache: dict[str, list[float]]) -> None:
+    """Write via a temp file + os.replace so a killed or concurrent run never leaves it truncated."""
+    EMBED_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp = EMBED_CACHE_PATH.with_name(f"{EMBED_CACHE_PATH.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(json.dumps(cache))
+        os.replace(tmp, EMBED_CACHE_PATH)
+    except OSError:
+        tmp.unlink(missing_ok=True)  # cache is best-effort; search still works without it
+
+
+def _cache_key(query: str) -> str:
+    """Hash of model + query so switching EMBED_MODEL never serves stale vectors."""
+    return hashlib.sha1(f"{EMBED_MODEL}\0{query}".encode()).hexdigest()
+
+
+def _embed_queries(queries: list[str]) -> list[list[float]]:
+    """Embed queries, encoding only unseen ones (deduped, in one batch) and persisting them."""
+    cache, keys = _embedding_cache(), [_cache_key(q) for q in queries]
+    misses = list(dict.fromkeys(q for q, k in zip(queries, keys) if k not in cache))
+    if misses:
+        # Unit-length like the ingested corpus vectors; cosine scores are unaffected
+        vectors = _get_embedder().encode(misses, convert_to_numpy=True, normalize_embeddings=True)
+        cache.update(zip(map(_cache_key, misses), vectors.tolist()))
+        _save_embedding_cache(cache)
+    return [cache[k] for k in keys]
+
+
+def scored_search_batch(queries: list[str], top_k: int = 3) -> list[list[tuple[Verse, float]]]:
+    """Encode all queries in one forward pass and run them as one Qdrant batch; hits keep their cosine score."""
+    client = _get_qdrant_client()
+    if client is None or not queries:
+        return [[] for _ in queries]
+    from qdrant_client.models import QueryRequest
+    embeddings = _embed_queries(queries)
+    requests = [QueryRequest(query=e, limit=top_k, with_payload=True) for e in embeddings]
+    responses = client.query_batch_points(collection_name=COLLECTION_NAME, requests=requests)
+    return [[(Verse(**pt.payload), pt.score) for pt in r.points] for r in responses]
+
+
+def semantic_search_batch(queries: list[str], top_k: int = 3) -> list[list[Verse]]:
+    """Batched semantic search without scores."""
+    return [[v for v, _ in hits] for hits in scored_search_batch(queries, top_k)]
 
 
 def semantic_search(query: str, top_k: int = 3) -> list[Verse]:
     """Encode query and search Qdrant; returns Verse objects from payloads."""
-    client = _get_qdrant_client()
-    if client is None:
-        return []
-    embedding = _get_embedder().encode(query).tolist()
-    result = client.query_points(collection_name=COLLECTION_NAME, query=embedding, limit=top_k)
-    return [Verse(**pt.payload) for pt in result.points]
+    return semantic_search_batch([query], top_k)[0]
+
+
+def _search_tags(v: Verse) -> list[str]:
+    return v.tags + (v.use_cases or []) + (v.observance_tags or []) + (v.birth_tags or [])
+
+
+@lru_cache(maxsize=1)
+def _keyword_index() -> tuple[list[Verse], dict[str, list[int]], list[str]]:
+    """Verses, tag -> verse indices (one entry per occurrence) and lowercased meanings, built once."""
+    verses = load_verses()
+    pairs = sorted((t, i) for i, v in enumerate(verses) for t in _search_tags(v))
+    tag_index = {t: [i for _, i in group] for t, group in groupby(pairs, key=itemgetter(0))}
+    return verses, tag_index, [v.meaning.lower() for v in verses]
 
 
 def keyword_search(query: str, top_k: int = 3) -> list[Verse]:
     """Keyword search over verses. Returns top_k matches."""
     query_lower = query.lower()
-    verses = load_verses()
-    def tags(v: Verse) -> list[str]:
-        return v.tags + (v.use_cases or []) + (v.observance_tags or []) + (v.birth_tags or [])
-    scored = [
-        (v, sum(t in query_lower for t in tags(v)) + (query_lower in v.meaning.lower()))
-        for v in verses
-    ]
-    scored.sort(key=lambda x: x[1], reverse=True)
-    return [v for v, s in scored[:top_k] if s > 0]
+    verses, tag_index, meanings = _keyword_index()
+    # Score = tags contained in the query + 1 if the whole query appears in the meaning
+    scores = Counter(i for t, hits in tag_index.items() if t in query_lower for i in hits)
+    scores.update(i for i, m in enumerate(meanings) if query_lower in m)
+    # Highest score first, earlier verse on ties (same order as a stable sort)
+    top = heapq.nlargest(top_k, scores.items(), key=lambda kv: (kv[1], -kv[0]))
+    return [verses[i] for i, _ in top]
 
 
 def search(query: str, top_k: int = 3) -> list[Verse]:
@@ -87,6 +160,15 @@ def search(query: str, top_k: int = 3) -> list[Verse]:
     return semantic_search(query, top_k) or keyword_search(query, top_k)
 
 
+def warmup() -> None:
+    """Open the Qdrant store and load the embedder ahead of the first query.
+
+    Entrypoints call this when VERSE_SEARCH_WARMUP is set; importing this module never does.
+    """
+    if _get_qdrant_client() is not None:
+        _get_embedder().encode("warmup")
+
+
 def format_verse(v: Verse) -> str:
     """Format a verse with all three representations."""
     return f"{v.devanagari}\n{v.transliteration}\n— {v.meaning}\n[{v.source}]"
@@ -0,0 +1,8 @@
+"""Put the script directories on sys.path, as the scripts themselves do at run time."""
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+for _dir in (ROOT / "scripts", ROOT / "skills" / "sanskrit-wisdom" / "scripts", ROOT / "skills" / "karpathy-code-quality"):
+    if str(_dir) not in sys.path:
+        sys.path.insert(0, str(_dir))
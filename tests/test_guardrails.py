@@ -0,0 +1,56 @@
+"""Tests for the guardrails lint rules and its per-file result cache."""
+import pytest
+
+import guardrails
+
+NESTED_TRY = "try:\n    try:\n        pass\n    except Exception:\n        pass\nexcept Exception:\n    pass\n"
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    monkeypatch.setattr(guardrails, "CACHE_DIR", tmp_path / "cache")
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "a.py").write_text(NESTED_TRY)
+    (src / "b.py").write_text("x = 1\n")
+    return src
+
+
+def _rules(violations):
+    return sorted((v.file.rsplit("/", 1)[-1], v.rule) for v in violations)
+
+
+def test_rules(tmp_path):
+    path = tmp_path / "m.py"
+    loop = "def f(xs):\n    out = []\n    for x in xs:\n        out.append(x)\n    return out\n"
+    path.write_text(NESTED_TRY + loop + "def g():\n" + "    pass\n" * 31)
+    assert sorted(v.rule for v in guardrails.lint_file(path)) == ["FUNC_TOO_LONG", "NO_NESTED_TRY", "USE_COMPREHENSION"]
+
+
+def test_unchanged_files_come_from_cache(tree, monkeypatch):
+    first = guardrails.lint_directory(tree)
+    monkeypatch.setattr(guardrails, "lint_file", lambda p: pytest.fail(f"re-linted {p}"))
+    assert guardrails.lint_directory(tree) == first
+    assert _rules(first) == [("a.py", "NO_NESTED_TRY")]
+
+
+def test_changed_and_deleted_files_are_relinted(tree):
+    guardrails.lint_directory(tree)
+    (tree / "a.py").write_text("x = 2\n")
+    (tree / "b.py").write_text(NESTED_TRY + "\n")
+    assert _rules(guardrails.lint_directory(tree)) == [("b.py", "NO_NESTED_TRY")]
+    (tree / "b.py").unlink()
+    assert guardrails.lint_directory(tree) == []
+
+
+def test_corrupt_cache_falls_back_to_full_lint(tree):
+    cache_path = guardrails._cache_path(tree)
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_text("{not json")
+    assert _rules(guardrails.lint_directory(tree)) == [("a.py", "NO_NESTED_TRY")]
+
+
+def test_cache_is_written_outside_the_linted_tree(tree):
+    guardrails.lint_directory(tree)
+    assert sorted(p.name for p in tree.iterdir()) == ["a.py", "b.py"]
+    assert guardrails._cache_path(tree).exists()
@@ -0,0 +1,74 @@
+"""Tests for http_retry.request_with_retry's retry policy."""
+import httpx
+import pytest
+
+import http_retry
+
+
+class FakeClient:
+    """Replays a scripted sequence of responses (status, headers) or exceptions."""
+
+    def __init__(self, *script):
+        self.script, self.calls = list(script), 0
+
+    def request(self, method, url, **kwargs):
+        step = self.script[self.calls]
+        self.calls += 1
+        if isinstance(step, Exception):
+            raise step
+        status, headers = step
+        return httpx.Response(status, headers=headers, request=httpx.Request(method, url))
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    slept = []
+    monkeypatch.setattr(http_retry.time, "sleep", slept.append)
+    return slept
+
+
+def test_get_retries_server_errors(sleeps):
+    client = FakeClient((502, {}), (504, {}), (200, {}))
+    assert http_retry.request_with_retry(client, "GET", "http://x").status_code == 200
+    assert client.calls == 3 and len(sleeps) == 2
+
+
+def test_retry_after_is_capped(sleeps):
+    client = FakeClient((429, {"Retry-After": "600"}), (200, {}))
+    http_retry.request_with_retry(client, "GET", "http://x")
+    assert sleeps == [http_retry.MAX_DELAY]
+
+
+def test_gives_up_after_max_attempts(sleeps):
+    client = FakeClient(*[(503, {})] * http_retry.MAX_ATTEMPTS)
+    with pytest.raises(httpx.HTTPStatusError):
+        http_retry.request_with_retry(client, "GET", "http://x")
+    assert client.calls == http_retry.MAX_ATTEMPTS
+
+
+@pytest.mark.parametrize("status", [500, 502, 504])
+def test_post_is_not_resent_after_possible_write(sleeps, status):
+    client = FakeClient((status, {}), (200, {}))
+    with pytest.raises(httpx.HTTPStatusError):
+        http_retry.request_with_retry(client, "POST", "http://x")
+    assert client.calls == 1 and sleeps == []
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_post_retries_unprocessed_statuses(sleeps, status):
+    client = FakeClient((status, {}), (200, {}))
+    assert http_retry.request_with_retry(client, "POST", "http://x").status_code == 200
+
+
+def test_post_retries_connect_errors_only(sleeps):
+    client = FakeClient(httpx.ConnectError("refused"), (200, {}))
+    assert http_retry.request_with_retry(client, "POST", "http://x").status_code == 200
+    client = FakeClient(httpx.ReadTimeout("slow"), (200, {}))
+    with pytest.raises(httpx.ReadTimeout):
+        http_retry.request_with_retry(client, "POST", "http://x")
+    assert client.calls == 1
+
+
+def test_get_retries_transport_errors(sleeps):
+    client = FakeClient(httpx.ReadTimeout("slow"), (200, {}))
+    assert http_retry.request_with_retry(client, "GET", "http://x").status_code == 200
@@ -0,0 +1,56 @@
+"""Tests for verse_search.keyword_search scoring and ordering."""
+import json
+
+import pytest
+
+import verse_search
+
+
+def _verse(vid, tags, meaning=""):
+    return {"id": vid, "devanagari": "", "transliteration": "", "meaning": meaning, "source": vid, "tags": tags}
+
+
+@pytest.fixture
+def corpus(tmp_path, monkeypatch):
+    def install(*verses):
+        path = tmp_path / "verses.json"
+        path.write_text(json.dumps(list(verses)))
+        monkeypatch.setattr(verse_search, "VERSES_PATH", path)
+        verse_search._keyword_index.cache_clear()
+    yield install
+    verse_search._keyword_index.cache_clear()
+
+
+def _ids(query, top_k=3):
+    return [v.id for v in verse_search.keyword_search(query, top_k)]
+
+
+def test_more_matching_tags_rank_first(corpus):
+    corpus(_verse("one", ["vishnu"]), _verse("two", ["vishnu", "ekadashi"]), _verse("none", ["shiva"]))
+    assert _ids("Vishnu ekadashi devotion") == ["two", "one"]
+
+
+def test_ties_keep_corpus_order(corpus):
+    corpus(_verse("a", ["karma"]), _verse("b", ["karma"]), _verse("c", ["karma"]), _verse("d", ["karma"]))
+    assert _ids("karma yoga") == ["a", "b", "c"]
+    assert _ids("karma yoga", top_k=1) == ["a"]
+
+
+def test_tags_match_as_substrings_of_the_query(corpus):
+    corpus(_verse("multi", ["pitru tarpanam"]), _verse("other", ["tarpanam pitru"]))
+    assert _ids("amavasya pitru tarpanam") == ["multi"]
+
+
+def test_whole_query_in_meaning_scores_a_point(corpus):
+    corpus(_verse("meaning", [], meaning="Seek inner peace daily"), _verse("tag", ["peace"]), _verse("both", ["peace"], meaning="inner peace"))
+    assert _ids("inner peace") == ["both", "meaning", "tag"]
+
+
+def test_duplicate_tags_count_each_occurrence(corpus):
+    corpus(_verse("once", ["om"]), _verse("twice", ["om", "om"]))
+    assert _ids("om") == ["twice", "once"]
+
+
+def test_no_match_returns_empty(corpus):
+    corpus(_verse("a", ["shiva"]))
+    assert _ids("ganesha") == []
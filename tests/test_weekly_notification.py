@@ -0,0 +1,44 @@
+"""Tests for weekly_notification's semantic/keyword verse selection."""
+import pytest
+
+import weekly_notification as wn
+from verse_search import Verse
+
+
+def _verse(vid: str) -> Verse:
+    return Verse(id=vid, devanagari="", transliteration="", meaning="", source=vid, tags=[])
+
+
+@pytest.fixture
+def keyword(monkeypatch):
+    calls = []
+    def fake(query, top_k=3):
+        calls.append(query)
+        return [_verse("kw")]
+    monkeypatch.setattr(wn, "MIN_SEMANTIC_SCORE", 0.35)
+    monkeypatch.setattr(wn, "keyword_search", fake)
+    return calls
+
+
+def test_strong_semantic_hit_skips_keyword(keyword):
+    assert [v.id for v in wn._pick_hits("q", [(_verse("sem"), 0.8)])] == ["sem"]
+    assert keyword == []
+
+
+def test_weak_semantic_hit_defers_to_keyword(keyword):
+    assert [v.id for v in wn._pick_hits("q", [(_verse("sem"), 0.1)])] == ["kw"]
+    assert keyword == ["q"]
+
+
+def test_weak_semantic_hit_kept_without_keyword_match(monkeypatch, keyword):
+    monkeypatch.setattr(wn, "keyword_search", lambda query, top_k=3: [])
+    assert [v.id for v in wn._pick_hits("q", [(_verse("sem"), 0.1)])] == ["sem"]
+
+
+def test_no_semantic_hits_uses_keyword(keyword):
+    assert [v.id for v in wn._pick_hits("q", [])] == ["kw"]
+
+
+def test_default_cutoff_keeps_every_semantic_hit(monkeypatch):
+    monkeypatch.setattr(wn, "keyword_search", lambda query, top_k=3: [_verse("kw")])
+    assert [v.id for v in wn._pick_hits("q", [(_verse("sem"), -0.5)])] == ["sem"]